@@ -3,9 +3,17 @@ Data crawler that scans the canonical data structure and builds normalized entit
 
 Entities are plain dicts — source JSON fields pass through as-is, with only
 computed fields (UUIDs, slugs, foreign keys) overlaid on top.
+
+Crawling runs in two phases: every store and brand subtree is listed and its
+entity JSON files parsed as one task on a thread pool, then entities are built
+serially from the parsed documents (so output order never depends on thread
+scheduling).
 """
 
 import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .errors import BuildResult
@@ -19,10 +27,64 @@ from .utils import (
     generate_size_id,
     generate_store_id,
     generate_variant_id,
+    load_json,
     normalize_color_hex,
     slugify,
 )
 
+# Listing directories and reading small files release the GIL, so the scan and
+# parse phases run on a thread pool rather than in processes.
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# JSON files read at each directory level, starting at the stores/ and data/
+# roots themselves (which hold no entity files).
+_STORE_LEVEL_FILES = ((), ("store.json",))
+_DATA_LEVEL_FILES = (
+    (),
+    ("brand.json",),
+    ("material.json",),
+    ("filament.json",),
+    ("variant.json", "sizes.json"),
+)
+
+
+def _intern(value):
+    """Intern a string value; anything else is returned unchanged.
+
+    Used for low-cardinality fields (material, origin, country codes) that are
+    repeated across thousands of entities, so each distinct value is stored once.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_list(value) -> list:
+    """ensure_list() with each string element interned."""
+    return [_intern(item) for item in ensure_list(value)]
+
+
+def _scan_directory(path: Path, leaf: bool = False) -> tuple[list[Path], set[str]]:
+    """Scan a directory once for its subdirectories and file names.
+
+    Returns the non-hidden subdirectories sorted by name, plus the set of names
+    of everything else in the directory. Uses os.scandir so entry types come
+    from the directory listing itself, and callers test the file-name set
+    instead of issuing a stat() per expected JSON file.
+
+    Subdirectory order is what entities are emitted in (exporters do not
+    re-sort), so it is kept deterministic. For a leaf directory, whose
+    subdirectories are never visited, the list is left empty instead.
+    """
+    subdir_names = []
+    file_names = set()
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if not leaf and not entry.name.startswith("."):
+                    subdir_names.append(entry.name)
+            else:
+                file_names.add(entry.name)
+    return [path / name for name in sorted(subdir_names)], file_names
+
 
 class DataCrawler:
     """Crawls the data directory structure and builds normalized database."""
@@ -33,6 +95,11 @@ class DataCrawler:
         self.db = Database()
         self._result = BuildResult()
 
+        # Filled by the scan and parse phases before any entity is built
+        self._listings: dict[Path, tuple[list[Path], set[str]]] = {}
+        # directory -> {file name -> document or load error}
+        self._parsed: dict[Path, dict[str, object]] = {}
+
         # Caches for deduplication
         self._brand_cache: dict[str, str] = {}  # name -> id
         self._material_cache: dict[str, str] = {}  # brand_id:material -> id
@@ -42,6 +109,9 @@ class DataCrawler:
         """Crawl all data and return the populated database and any errors."""
         print("Starting data crawl...")
 
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            self._scan_and_parse(executor)
+
         # Crawl stores first (so we can validate purchase links)
         self._crawl_stores_directory()
 
@@ -60,6 +130,63 @@ class DataCrawler:
 
         return self.db, self._result
 
+    def _scan_and_parse(self, executor: ThreadPoolExecutor) -> None:
+        """Scan and parse phases: record every directory listing and parsed JSON file.
+
+        The roots are listed directly; each store and brand subtree is then
+        walked and parsed as one task on the executor, so per-task overhead is
+        paid per subtree rather than per file.
+        """
+        subtrees = []
+        for root, level_files in (
+            (self.stores_dir, _STORE_LEVEL_FILES),
+            (self.data_dir, _DATA_LEVEL_FILES),
+        ):
+            if root.exists():
+                self._listings[root] = subdirs, _ = _scan_directory(root)
+                subtrees.extend((subdir, level_files[1:]) for subdir in subdirs)
+
+        for listings, parsed in executor.map(lambda args: self._walk(*args), subtrees):
+            self._listings.update(listings)
+            self._parsed.update(parsed)
+
+    def _walk(self, top: Path, level_files: tuple) -> tuple[dict, dict]:
+        """List and parse a subtree down to the depth covered by level_files.
+
+        Returns the listing of each directory visited, plus the parse result
+        (document or load error) of each expected JSON file found in them.
+        """
+        listings = {}
+        parsed = {}
+        stack = [(top, 0)]
+        while stack:
+            path, depth = stack.pop()
+            leaf = depth + 1 == len(level_files)
+            listings[path] = subdirs, file_names = _scan_directory(path, leaf)
+            # Keyed by directory and name so no per-file Path is built or hashed
+            parsed[path] = {
+                name: self._parse_file(os.path.join(path, name))
+                for name in level_files[depth]
+                if name in file_names
+            }
+            if not leaf:
+                stack.extend((subdir, depth + 1) for subdir in subdirs)
+        return listings, parsed
+
+    def _parse_file(self, path: str):
+        """Parse phase: load one JSON file, returning the load error instead of raising."""
+        try:
+            return load_json(path)
+        except (OSError, json.JSONDecodeError) as e:
+            return e
+
+    def _load_json(self, directory: Path, name: str):
+        """Take the pre-parsed document for a file, re-raising its load error if any."""
+        parsed = self._parsed[directory].pop(name)
+        if isinstance(parsed, Exception):
+            raise parsed
+        return parsed
+
     def _crawl_stores_directory(self):
         """Crawl the stores/ directory."""
         if not self.stores_dir.exists():
@@ -68,23 +195,19 @@ class DataCrawler:
             )
             return
 
-        for store_dir in sorted(self.stores_dir.iterdir()):
-            if not store_dir.is_dir():
-                continue
-            if store_dir.name.startswith("."):
-                continue
-
+        store_dirs, _ = self._listings[self.stores_dir]
+        for store_dir in store_dirs:
             self._process_store_directory(store_dir)
 
     def _process_store_directory(self, store_dir: Path):
         """Process a store directory."""
-        store_json = store_dir / "store.json"
-        if not store_json.exists():
+        _, file_names = self._listings[store_dir]
+        if "store.json" not in file_names:
             return
+        store_json = store_dir / "store.json"
 
         try:
-            with open(store_json, encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._load_json(store_dir, "store.json")
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", store_json)
             return
@@ -98,20 +221,22 @@ class DataCrawler:
         store_id = generate_store_id(original_id)
 
         # Start with all source data, overlay computed fields
-        store = {
-            **data,
-            "id": store_id,
-            # Canonical UUID stored in source JSON, independent of slug/id. None
-            # when unassigned (stripped on export); assigned by CI on merge.
-            "uuid": data.get("uuid") or None,
-            "name": data.get("name", store_dir.name),
-            "slug": slugify(data.get("id", store_dir.name)),
-            "directory_name": store_dir.name,  # internal, stripped on export
-            "storefront_url": data.get("storefront_url", ""),
-            "logo": data.get("logo", ""),
-            "ships_from": ensure_list(data.get("ships_from", [])),
-            "ships_to": ensure_list(data.get("ships_to", [])),
-        }
+        store = data
+        store.update(
+            {
+                "id": store_id,
+                # Canonical UUID stored in source JSON, independent of slug/id. None
+                # when unassigned (stripped on export); assigned by CI on merge.
+                "uuid": data.get("uuid") or None,
+                "name": data.get("name", store_dir.name),
+                "slug": slugify(data.get("id", store_dir.name)),
+                "directory_name": store_dir.name,  # internal, stripped on export
+                "storefront_url": data.get("storefront_url", ""),
+                "logo": data.get("logo", ""),
+                "ships_from": _intern_list(data.get("ships_from", [])),
+                "ships_to": _intern_list(data.get("ships_to", [])),
+            }
+        )
 
         self.db.stores.append(store)
         self._store_cache[original_id] = store_id
@@ -123,12 +248,11 @@ class DataCrawler:
             return
 
         # Each subdirectory of data/ is a brand
-        for brand_dir in sorted(self.data_dir.iterdir()):
-            if not brand_dir.is_dir():
-                continue
-            if brand_dir.name.startswith("."):
-                continue
+        brand_dirs, _ = self._listings[self.data_dir]
 
+        # All I/O happened in the scan and parse phases, so building is a pure
+        # transformation of the parsed documents, one brand at a time.
+        for brand_dir in brand_dirs:
             self._process_brand_directory(brand_dir)
 
     def _process_brand_directory(self, brand_dir: Path):
@@ -136,14 +260,14 @@ class DataCrawler:
         brand_name = brand_dir.name
 
         # Load brand.json
+        material_dirs, file_names = self._listings[brand_dir]
         brand_json = brand_dir / "brand.json"
-        if not brand_json.exists():
+        if "brand.json" not in file_names:
             self._result.add_warning("Missing File", "Missing brand.json", brand_dir)
             return
 
         try:
-            with open(brand_json, encoding="utf-8") as f:
-                brand_data = json.load(f)
+            brand_data = self._load_json(brand_dir, "brand.json")
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", brand_json)
             return
@@ -151,32 +275,29 @@ class DataCrawler:
         # Create brand
         brand_id = generate_brand_id(brand_name)
 
-        brand = {
-            **brand_data,
-            "id": brand_id,
-            "uuid": brand_data.get("uuid") or None,
-            "name": brand_data.get("name", brand_name),
-            # Slug must match the on-disk directory so cloud paths round-trip back
-            # to the repo (PR building maps brands/<slug> -> data/<slug>/). Mirror
-            # the store convention: derive from the source id, falling back to the
-            # directory name — NOT from brand_id, which is a generated UUID.
-            "slug": slugify(brand_data.get("id", brand_name)),
-            "directory_name": brand_name,  # internal, stripped on export
-            "website": brand_data.get("website", ""),
-            "logo": brand_data.get("logo", ""),
-            "origin": brand_data.get("origin", "Unknown"),
-        }
+        brand = brand_data
+        brand.update(
+            {
+                "id": brand_id,
+                "uuid": brand_data.get("uuid") or None,
+                "name": brand_data.get("name", brand_name),
+                # Slug must match the on-disk directory so cloud paths round-trip back
+                # to the repo (PR building maps brands/<slug> -> data/<slug>/). Mirror
+                # the store convention: derive from the source id, falling back to the
+                # directory name — NOT from brand_id, which is a generated UUID.
+                "slug": slugify(brand_data.get("id", brand_name)),
+                "directory_name": brand_name,  # internal, stripped on export
+                "website": brand_data.get("website", ""),
+                "logo": brand_data.get("logo", ""),
+                "origin": _intern(brand_data.get("origin", "Unknown")),
+            }
+        )
 
         self.db.brands.append(brand)
         self._brand_cache[brand_name] = brand_id
 
         # Each subdirectory is a material type
-        for material_dir in sorted(brand_dir.iterdir()):
-            if not material_dir.is_dir():
-                continue
-            if material_dir.name.startswith("."):
-                continue
-
+        for material_dir in material_dirs:
             self._process_material_directory(material_dir, brand_id)
 
     def _process_material_directory(self, material_dir: Path, brand_id: str):
@@ -184,12 +305,12 @@ class DataCrawler:
         material_name = material_dir.name
 
         # Load material.json if exists
+        filament_dirs, file_names = self._listings[material_dir]
         material_json = material_dir / "material.json"
         material_data = {}
-        if material_json.exists():
+        if "material.json" in file_names:
             try:
-                with open(material_json, encoding="utf-8") as f:
-                    material_data = json.load(f)
+                material_data = self._load_json(material_dir, "material.json")
             except (OSError, json.JSONDecodeError) as e:
                 self._result.add_warning("JSON Parse", f"Failed to parse: {e}", material_json)
 
@@ -199,26 +320,23 @@ class DataCrawler:
 
         if cache_key not in self._material_cache:
             # Pass through all source data, overlay computed fields
-            material = {
-                **material_data,
-                "id": material_id,
-                "uuid": material_data.get("uuid") or None,
-                "brand_id": brand_id,
-                "material": material_data.get("material", material_name),
-                "slug": material_data.get("material", material_name),
-                "material_class": material_data.get("material_class", "FFF"),
-            }
+            material = material_data
+            material.update(
+                {
+                    "id": material_id,
+                    "uuid": material_data.get("uuid") or None,
+                    "brand_id": brand_id,
+                    "material": _intern(material_data.get("material", material_name)),
+                    "slug": _intern(material_data.get("material", material_name)),
+                    "material_class": _intern(material_data.get("material_class", "FFF")),
+                }
+            )
 
             self.db.materials.append(material)
             self._material_cache[cache_key] = material_id
 
         # Each subdirectory is a filament line
-        for filament_dir in sorted(material_dir.iterdir()):
-            if not filament_dir.is_dir():
-                continue
-            if filament_dir.name.startswith("."):
-                continue
-
+        for filament_dir in filament_dirs:
             self._process_filament_directory(filament_dir, brand_id, material_id, material_name)
 
     def _process_filament_directory(
@@ -226,14 +344,14 @@ class DataCrawler:
     ):
         """Process a filament directory."""
         # Load filament.json
+        variant_dirs, file_names = self._listings[filament_dir]
         filament_json = filament_dir / "filament.json"
-        if not filament_json.exists():
+        if "filament.json" not in file_names:
             self._result.add_warning("Missing File", "Missing filament.json", filament_dir)
             return
 
         try:
-            with open(filament_json, encoding="utf-8") as f:
-                filament_data = json.load(f)
+            filament_data = self._load_json(filament_dir, "filament.json")
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", filament_json)
             return
@@ -245,43 +363,40 @@ class DataCrawler:
         # Generate filament ID using OFD standard algorithm
         filament_id = generate_filament_id(brand_id, material_id, filament_source_id)
 
-        # All source fields pass through via **filament_data
-        filament = {
-            **filament_data,
-            "id": filament_id,
-            "uuid": filament_data.get("uuid") or None,
-            "brand_id": brand_id,
-            "material_id": material_id,
-            "name": filament_name,
-            "slug": slugify(filament_source_id),
-            "material": material_name,
-            "density": filament_data.get("density", 1.24),
-            "diameter_tolerance": filament_data.get("diameter_tolerance", 0.02),
-            "discontinued": filament_data.get("discontinued", False),
-        }
+        # All source fields pass through; computed fields are overlaid in place
+        filament = filament_data
+        filament.update(
+            {
+                "id": filament_id,
+                "uuid": filament_data.get("uuid") or None,
+                "brand_id": brand_id,
+                "material_id": material_id,
+                "name": filament_name,
+                "slug": slugify(filament_source_id),
+                "material": _intern(material_name),
+                "density": filament_data.get("density", 1.24),
+                "diameter_tolerance": filament_data.get("diameter_tolerance", 0.02),
+                "discontinued": filament_data.get("discontinued", False),
+            }
+        )
 
         self.db.filaments.append(filament)
 
         # Each subdirectory is a color variant
-        for variant_dir in sorted(filament_dir.iterdir()):
-            if not variant_dir.is_dir():
-                continue
-            if variant_dir.name.startswith("."):
-                continue
-
+        for variant_dir in variant_dirs:
             self._process_variant_directory(variant_dir, filament_id)
 
     def _process_variant_directory(self, variant_dir: Path, filament_id: str):
         """Process a variant (color) directory."""
         # Load variant.json
+        _, file_names = self._listings[variant_dir]
         variant_json = variant_dir / "variant.json"
-        if not variant_json.exists():
+        if "variant.json" not in file_names:
             self._result.add_warning("Missing File", "Missing variant.json", variant_dir)
             return
 
         try:
-            with open(variant_json, encoding="utf-8") as f:
-                variant_data = json.load(f)
+            variant_data = self._load_json(variant_dir, "variant.json")
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", variant_json)
             return
@@ -299,38 +414,42 @@ class DataCrawler:
             color_hex = normalize_color_hex(color_hex_raw[0]) if color_hex_raw else "#000000"
         else:
             color_hex = normalize_color_hex(color_hex_raw) or "#000000"
+        # Black, white, greys etc. recur across thousands of variants
+        color_hex = _intern(color_hex)
 
         # Normalize hex variants if present
         hex_variants = variant_data.get("hex_variants")
         if hex_variants:
-            hex_variants = [normalize_color_hex(h) for h in hex_variants if h]
-
-        # All source fields pass through via **variant_data (traits, color_standards, etc.)
-        variant = {
-            **variant_data,
-            "id": variant_id,
-            "uuid": variant_data.get("uuid") or None,
-            "filament_id": filament_id,
-            "slug": slugify(variant_source_id),
-            "name": color_name,
-            "color_hex": color_hex,
-            "discontinued": variant_data.get("discontinued", False),
-        }
+            hex_variants = [_intern(normalize_color_hex(h)) for h in hex_variants if h]
+
+        # All source fields pass through (traits, color_standards, etc.); computed
+        # fields are overlaid in place
+        variant = variant_data
+        variant.update(
+            {
+                "id": variant_id,
+                "uuid": variant_data.get("uuid") or None,
+                "filament_id": filament_id,
+                "slug": slugify(variant_source_id),
+                "name": color_name,
+                "color_hex": color_hex,
+                "discontinued": variant_data.get("discontinued", False),
+            }
+        )
         if hex_variants:
             variant["hex_variants"] = hex_variants
 
         self.db.variants.append(variant)
 
         # Load sizes.json
-        sizes_json = variant_dir / "sizes.json"
-        if sizes_json.exists():
-            self._process_sizes_file(sizes_json, variant_id)
+        if "sizes.json" in file_names:
+            self._process_sizes_file(variant_dir, variant_id)
 
-    def _process_sizes_file(self, sizes_json: Path, variant_id: str):
-        """Process sizes.json file to create sizes and purchase links."""
+    def _process_sizes_file(self, variant_dir: Path, variant_id: str):
+        """Process a variant's sizes.json file to create sizes and purchase links."""
+        sizes_json = variant_dir / "sizes.json"
         try:
-            with open(sizes_json, encoding="utf-8") as f:
-                sizes_data = json.load(f)
+            sizes_data = self._load_json(variant_dir, "sizes.json")
         except (OSError, json.JSONDecodeError) as e:
             self._result.add_warning("JSON Parse", f"Failed to parse: {e}", sizes_json)
             return
@@ -364,15 +483,17 @@ class DataCrawler:
         purchase_links_data = size_entry.get("purchase_links", [])
 
         # All source fields pass through, overlay computed fields
-        size = {
-            **size_entry,
-            "id": size_id,
-            "uuid": size_entry.get("uuid") or None,
-            "variant_id": variant_id,
-            "filament_weight": int(weight),
-            "diameter": float(diameter),
-            "discontinued": size_entry.get("discontinued", False),
-        }
+        size = size_entry
+        size.update(
+            {
+                "id": size_id,
+                "uuid": size_entry.get("uuid") or None,
+                "variant_id": variant_id,
+                "filament_weight": int(weight),
+                "diameter": float(diameter),
+                "discontinued": size_entry.get("discontinued", False),
+            }
+        )
         if gtin:
             size["gtin"] = gtin
         # Remove ean if we normalized it to gtin
@@ -414,19 +535,21 @@ class DataCrawler:
         pl_id = generate_purchase_link_id(size_id, store_uuid, url)
 
         # All source fields pass through, overlay computed fields
-        purchase_link = {
-            **pl_entry,
-            "id": pl_id,
-            "size_id": size_id,
-            "store_id": store_uuid,
-            "url": url,
-            "spool_refill": pl_entry.get("spool_refill", False),
-        }
+        purchase_link = pl_entry
+        purchase_link.update(
+            {
+                "id": pl_id,
+                "size_id": size_id,
+                "store_id": store_uuid,
+                "url": url,
+                "spool_refill": pl_entry.get("spool_refill", False),
+            }
+        )
         # Normalize ships_from/ships_to if present
         if purchase_link.get("ships_from"):
-            purchase_link["ships_from"] = ensure_list(purchase_link["ships_from"])
+            purchase_link["ships_from"] = _intern_list(purchase_link["ships_from"])
         if purchase_link.get("ships_to"):
-            purchase_link["ships_to"] = ensure_list(purchase_link["ships_to"])
+            purchase_link["ships_to"] = _intern_list(purchase_link["ships_to"])
 
         self.db.purchase_links.append(purchase_link)
 
@@ -136,11 +136,22 @@ def export_schemas(
     return len(schema_files)
 
 
+# Shared encoder for API files; json.dump(indent=2, ...) matches its output
+_encode_indented = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+
 def write_json(path: Path, data: dict):
     """Write JSON file with consistent formatting."""
     path.parent.mkdir(parents=True, exist_ok=True)
+    _write_json_file(path, data)
+
+
+def _write_json_file(path: str | Path, data: dict):
+    """write_json() for a path whose parent directory is known to exist."""
+    # One encode() and one write, rather than json.dump's new encoder per call
+    # and a file write per token
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write(_encode_indented(data))
 
 
 def generate_logo_id(name: str, logo_filename: str) -> tuple[str, str]:
@@ -503,8 +514,13 @@ def export_api(
                 write_json(fil_path / "index.json", fil_data)
                 filament_count += 1
 
-                # Per-variant files (leaf level - includes sizes and purchase links)
+                # Per-variant files (leaf level - includes sizes and purchase links).
+                # The directory is created once and file paths are plain strings,
+                # since this loop writes the bulk of the API's files.
                 variants_path = fil_path / "variants"
+                if fil_variants:
+                    variants_path.mkdir(parents=True, exist_ok=True)
+                variants_dir = str(variants_path)
                 for var in fil_variants:
                     var_sizes = sizes_by_variant.get(var["id"], [])
 
@@ -519,7 +535,7 @@ def export_api(
 
                     var_data = entity_to_dict(var)
                     var_data["sizes"] = sizes_data
-                    write_json(variants_path / f"{var['slug']}.json", var_data)
+                    _write_json_file(f"{variants_dir}/{var['slug']}.json", var_data)
                     variant_count += 1
 
     print(
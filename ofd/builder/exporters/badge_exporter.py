@@ -5,17 +5,29 @@ Produces flat-style badges matching the shields.io aesthetic, served as static
 files from the API domain - no external service dependency per page visit.
 """
 
+import functools
 from pathlib import Path
 from xml.sax.saxutils import escape
 
 from ..models import Database
 
-# Approximate character width for Verdana 11px (the standard badge font).
-# This uses a simplified average; shields.io uses a full char-width table but
-# for the counts and short labels here, 6.8px/char is close enough.
-_CHAR_WIDTH = 6.8
+# Advance widths in px of printable ASCII (space through "~") at 11px in DejaVu
+# Sans, the Verdana-metric-compatible face in our font stack. Taken from the
+# pybadges DejaVu Sans 110pt table scaled by 1/10. Other characters fall back
+# to that table's mean width.
+_ASCII_WIDTHS = (
+    3.5, 4.4, 5.1, 9.2, 7.0, 10.5, 8.6, 3.0, 4.3, 4.3, 5.5, 9.2, 3.5, 4.0, 3.5, 3.8,
+    7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 3.7, 3.7, 9.2, 9.2, 9.2, 5.8,
+    11.0, 7.5, 7.5, 7.7, 8.5, 7.0, 6.3, 8.5, 8.3, 3.2, 3.8, 7.5, 6.1, 9.5, 8.2, 8.7,
+    6.6, 8.7, 7.6, 7.0, 6.9, 8.1, 7.5, 10.9, 7.5, 6.9, 7.5, 4.3, 3.8, 4.3, 9.2, 5.9,
+    5.5, 6.7, 7.0, 6.0, 7.0, 6.8, 4.1, 7.0, 7.0, 3.1, 3.3, 6.4, 3.1, 10.7, 7.0, 6.7,
+    7.0, 7.0, 4.6, 5.7, 4.3, 7.0, 6.5, 9.0, 6.5, 6.5, 5.8, 7.0, 3.7, 7.0, 9.2,
+)  # fmt: skip
+_CHAR_WIDTHS = {chr(32 + i): width for i, width in enumerate(_ASCII_WIDTHS)}
+_DEFAULT_CHAR_WIDTH = 7.7
 _PADDING = 10  # horizontal padding on each side of label/value
 _HEIGHT = 20
+_TEXT_Y = 14  # baseline for 20px height badge
 _FONT_SIZE = 11
 _FONT_FAMILY = "Verdana,Geneva,DejaVu Sans,sans-serif"
 
@@ -26,10 +38,32 @@ COLORS = {
     "purple": "#9f59c4",
 }
 
+# Built once at import; _render_badge only fills in the per-badge values.
+_SVG_TEMPLATE = f'''<svg xmlns="http://www.w3.org/2000/svg" width="{{total_w}}" height="{_HEIGHT}">
+  <linearGradient id="s" x2="0" y2="100%">
+    <stop offset="0" stop-color="#bbb" stop-opacity=".1"/>
+    <stop offset="1" stop-opacity=".1"/>
+  </linearGradient>
+  <clipPath id="r"><rect width="{{total_w}}" height="{_HEIGHT}" rx="3" fill="#fff"/></clipPath>
+  <g clip-path="url(#r)">
+    <rect width="{{label_w}}" height="{_HEIGHT}" fill="#555"/>
+    <rect x="{{label_w}}" width="{{value_w}}" height="{_HEIGHT}" fill="{{hex_color}}"/>
+    <rect width="{{total_w}}" height="{_HEIGHT}" fill="url(#s)"/>
+  </g>
+  <g fill="#fff" text-anchor="middle" font-family="{_FONT_FAMILY}" text-rendering="geometricPrecision" font-size="{_FONT_SIZE}">
+    <text x="{{label_x}}" y="{_TEXT_Y + 1}" fill="#010101" fill-opacity=".3">{{label}}</text>
+    <text x="{{label_x}}" y="{_TEXT_Y}">{{label}}</text>
+    <text x="{{value_x}}" y="{_TEXT_Y + 1}" fill="#010101" fill-opacity=".3">{{value}}</text>
+    <text x="{{value_x}}" y="{_TEXT_Y}">{{value}}</text>
+  </g>
+</svg>'''
+_format_svg = _SVG_TEMPLATE.format
+
 
+@functools.lru_cache(maxsize=256)
 def _text_width(text: str) -> float:
     """Estimate rendered text width in pixels."""
-    return len(text) * _CHAR_WIDTH
+    return sum(_CHAR_WIDTHS.get(ch, _DEFAULT_CHAR_WIDTH) for ch in text)
 
 
 def _render_badge(label: str, value: str, color: str) -> str:
@@ -40,28 +74,16 @@ def _render_badge(label: str, value: str, color: str) -> str:
     value_w = round(_text_width(value) + _PADDING * 2, 1)
     total_w = round(label_w + value_w, 1)
 
-    label_x = round(label_w / 2, 1)
-    value_x = round(label_w + value_w / 2, 1)
-    text_y = 14  # baseline for 20px height badge
-
-    return f'''<svg xmlns="http://www.w3.org/2000/svg" width="{total_w}" height="{_HEIGHT}">
-  <linearGradient id="s" x2="0" y2="100%">
-    <stop offset="0" stop-color="#bbb" stop-opacity=".1"/>
-    <stop offset="1" stop-opacity=".1"/>
-  </linearGradient>
-  <clipPath id="r"><rect width="{total_w}" height="{_HEIGHT}" rx="3" fill="#fff"/></clipPath>
-  <g clip-path="url(#r)">
-    <rect width="{label_w}" height="{_HEIGHT}" fill="#555"/>
-    <rect x="{label_w}" width="{value_w}" height="{_HEIGHT}" fill="{hex_color}"/>
-    <rect width="{total_w}" height="{_HEIGHT}" fill="url(#s)"/>
-  </g>
-  <g fill="#fff" text-anchor="middle" font-family="{_FONT_FAMILY}" text-rendering="geometricPrecision" font-size="{_FONT_SIZE}">
-    <text x="{label_x}" y="{text_y + 1}" fill="#010101" fill-opacity=".3">{escape(label)}</text>
-    <text x="{label_x}" y="{text_y}">{escape(label)}</text>
-    <text x="{value_x}" y="{text_y + 1}" fill="#010101" fill-opacity=".3">{escape(value)}</text>
-    <text x="{value_x}" y="{text_y}">{escape(value)}</text>
-  </g>
-</svg>'''
+    return _format_svg(
+        total_w=total_w,
+        label_w=label_w,
+        value_w=value_w,
+        hex_color=hex_color,
+        label_x=round(label_w / 2, 1),
+        value_x=round(label_w + value_w / 2, 1),
+        label=escape(label),
+        value=escape(value),
+    )
 
 
 def export_badges(db: Database, output_dir: str, **kwargs):
@@ -77,9 +99,8 @@ def export_badges(db: Database, output_dir: str, **kwargs):
     }
 
     for name, (label, value, color) in badges.items():
-        svg = _render_badge(label, value, color)
-        badge_file = badges_path / f"{name}.svg"
-        with open(badge_file, "w", encoding="utf-8") as f:
-            f.write(svg)
+        (badges_path / f"{name}.svg").write_text(
+            _render_badge(label, value, color), encoding="utf-8"
+        )
 
     print(f"  Written: {len(badges)} badge SVGs to {badges_path}")
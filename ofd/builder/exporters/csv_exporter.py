@@ -5,6 +5,8 @@ Derives headers from dict keys, making the exporter resilient to schema changes.
 """
 
 import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from ..models import Database
@@ -76,26 +78,49 @@ _KEY_ORDER = {
 # Keys that are internal and should never appear in CSV
 _INTERNAL_KEYS = {"directory_name"}
 
+# Write buffer size and number of rows serialized per writerows() call
+_BUFFER_SIZE = 1 << 20
+_BATCH_ROWS = 10_000
+
+# Tables with at least this many entities are written in worker processes
+# (serialization is CPU-bound); smaller ones aren't worth the pickling cost.
+_PARALLEL_MIN_ENTITIES = 1000
+
 
 def _derive_headers(entities: list[dict], entity_type: str) -> list[str]:
     """Derive CSV headers from dict keys with stable ordering."""
-    # Collect all keys across all entities
-    all_keys: set[str] = set()
+    # Collect all keys across all entities in one pass (dict as an ordered set)
+    seen: dict[str, None] = {}
     for entity in entities:
-        all_keys.update(entity.keys())
-
-    all_keys -= _INTERNAL_KEYS
+        for key in entity:
+            if key not in seen and key not in _INTERNAL_KEYS:
+                seen[key] = None
 
     # Handle logo -> logo_name rename for brands/stores
-    if "logo" in all_keys:
-        all_keys.discard("logo")
-        all_keys.add("logo_name")
+    if "logo" in seen:
+        del seen["logo"]
+        seen["logo_name"] = None
 
     # Start with preferred order, then append remaining keys alphabetically
     preferred = _KEY_ORDER.get(entity_type, [])
-    ordered = [k for k in preferred if k in all_keys]
-    remaining = sorted(all_keys - set(ordered))
-    return ordered + remaining
+    ordered = [k for k in preferred if k in seen]
+    ordered_set = set(ordered)
+    return ordered + sorted(k for k in seen if k not in ordered_set)
+
+
+def _serialize_column(values: list) -> list[str]:
+    """Serialize one CSV column, specializing on the value types it contains.
+
+    Columns holding only strings or only numbers (plus None) skip the generic
+    per-value type dispatch of serialize_for_csv; mixed columns still use it.
+    """
+    types = set(map(type, values))
+    types.discard(type(None))
+    if types <= {str}:
+        return ["" if v is None else v for v in values]
+    if types <= {int, float}:
+        return ["" if v is None else str(v) for v in values]
+    return [serialize_for_csv(v) for v in values]
 
 
 def _export_entity_csv(
@@ -114,14 +139,17 @@ def _export_entity_csv(
 
     headers = _derive_headers(entities, entity_type)
 
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+    with open(csv_path, "w", newline="", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         writer.writerow(headers)
 
-        for entity in entities:
-            exported = entity_to_dict(entity)
-            row = [serialize_for_csv(exported.get(h)) for h in headers]
-            writer.writerow(row)
+        # Serialize column by column against the shared header schema, then zip
+        # the columns back into rows. Batching caps the serialized rows held in
+        # memory at once for the large tables (sizes, variants).
+        for start in range(0, len(entities), _BATCH_ROWS):
+            exported = [entity_to_dict(e) for e in entities[start : start + _BATCH_ROWS]]
+            columns = [_serialize_column([row.get(h) for row in exported]) for h in headers]
+            writer.writerows(zip(*columns, strict=True))
 
     return csv_path
 
@@ -141,6 +169,32 @@ def export_csv(db: Database, output_dir: str, version: str, generated_at: str):
         (db.purchase_links, "purchase_link", "purchase_links.csv"),
     ]
 
-    for entities, entity_type, filename in exports:
-        csv_path = _export_entity_csv(entities, entity_type, output_path, filename)
-        print(f"  Written: {csv_path}")
+    # Large tables go to worker processes (one per table, capped by CPU count);
+    # with fewer than two workers available the export simply runs serially,
+    # without starting a pool.
+    large = [e for e in exports if len(e[0]) >= _PARALLEL_MIN_ENTITIES]
+    workers = min(len(large), os.cpu_count() or 1)
+    if workers < 2:
+        for entities, entity_type, filename in exports:
+            _export_entity_csv(entities, entity_type, output_path, filename)
+            print(f"  Written: {output_path / filename}")
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            filename: executor.submit(
+                _export_entity_csv, entities, entity_type, output_path, filename
+            )
+            for entities, entity_type, filename in large
+        }
+
+        # Small tables are written here while the workers run; results are
+        # reported in table order either way.
+        for entities, entity_type, filename in exports:
+            if filename not in futures:
+                _export_entity_csv(entities, entity_type, output_path, filename)
+
+        for _, _, filename in exports:
+            if filename in futures:
+                futures[filename].result()
+            print(f"  Written: {output_path / filename}")
@@ -4,34 +4,51 @@ Directory listing exporter that creates index.html files for all directories.
 Creates browsable directory listings for GitHub Pages compatibility.
 """
 
+import html
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
+# Listing pages are small stat/read/write jobs that release the GIL
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-def generate_listing_html(directory: Path, output_root: Path) -> str:
-    """Generate HTML listing for a directory's contents."""
-    items = sorted(directory.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower()))
+# Template placeholders, substituted in a single pass per page
+_PLACEHOLDER_RE = re.compile(r"<(PATH|ADWAITA_PATH|CSS_PATH|ROOT_PATH|LISTING)/>")
 
-    lines = ["<ul>"]
 
-    # Add parent directory link if not at root
-    if directory != output_root:
-        lines.append('<li><span class="dir"><a href="../">..</a></span></li>')
+def _fill_template(template: str, values: dict[str, str]) -> str:
+    """Substitute every <NAME/> placeholder in one scan of the template."""
+    return _PLACEHOLDER_RE.sub(lambda m: values[m[1]], template)
+
 
-    for item in items:
-        if item.name == "index.html":
-            continue
+def generate_listing_html(directory: Path, output_root: Path) -> str:
+    """Generate HTML listing for a directory's contents."""
+    # Directories first, then case-insensitive by name. Names are HTML-escaped
+    # once here, and scandir supplies each entry's type without another stat.
+    with os.scandir(directory) as it:
+        entries = [
+            (not entry.is_dir(), entry.name.lower(), html.escape(entry.name))
+            for entry in it
+            if entry.name != "index.html"
+        ]
+    entries.sort(key=itemgetter(0, 1))
 
-        if item.is_dir():
-            lines.append(
-                f'<li><span class="dir"><a href="{item.name}/">{item.name}/</a></span></li>'
-            )
-        else:
-            lines.append(
-                f'<li><span class="file"><a href="{item.name}">{item.name}</a></span></li>'
-            )
+    # Add parent directory link if not at root
+    parent = (
+        []
+        if directory == output_root
+        else ['<li><span class="dir"><a href="../">..</a></span></li>']
+    )
 
-    lines.append("</ul>")
-    return "\n".join(lines)
+    items = (
+        f'<li><span class="file"><a href="{name}">{name}</a></span></li>'
+        if is_file
+        else f'<li><span class="dir"><a href="{name}/">{name}/</a></span></li>'
+        for is_file, _, name in entries
+    )
+    return "\n".join(["<ul>", *parent, *items, "</ul>"])
 
 
 def export_directory_listings(output_dir: str, templates_dir: str = None, **kwargs):
@@ -51,42 +68,47 @@ def export_directory_listings(output_dir: str, templates_dir: str = None, **kwar
     with open(template_path, encoding="utf-8") as f:
         template = f.read()
 
-    count = 0
-
-    # Walk all directories
-    for dir_path in output_path.rglob("*"):
-        if not dir_path.is_dir():
-            continue
+    # Collect directories before writing, so new index.html files never race
+    # the walk. Each page only reads its own directory, and the work is
+    # almost all small-file I/O, so pages are written on a thread pool.
+    dir_paths = [p for p in output_path.rglob("*") if p.is_dir()]
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        count = sum(executor.map(lambda d: _write_listing(d, output_path, template), dir_paths))
 
-        index_file = dir_path / "index.html"
-
-        # Skip if index.html already exists
-        if index_file.exists():
-            continue
-
-        # Calculate paths
-        rel_path = "/" + str(dir_path.relative_to(output_path))
-        depth = len(dir_path.relative_to(output_path).parts)
-        base_path = "../" * depth
-        adwaita_path = base_path + "adwaita.css"
-        css_path = base_path + "theme.css"
-        root_path = base_path or "./"
-
-        # Generate listing
-        listing_html = generate_listing_html(dir_path, output_path)
-
-        # Process template
-        html = template
-        html = html.replace("<PATH/>", rel_path)
-        html = html.replace("<ADWAITA_PATH/>", adwaita_path)
-        html = html.replace("<CSS_PATH/>", css_path)
-        html = html.replace("<ROOT_PATH/>", root_path)
-        html = html.replace("<LISTING/>", listing_html)
-
-        # Write file
-        with open(index_file, "w", encoding="utf-8") as f:
-            f.write(html)
+    print(f"  Written: {count} directory listing pages")
 
-        count += 1
 
-    print(f"  Written: {count} directory listing pages")
+def _write_listing(dir_path: Path, output_path: Path, template: str) -> bool:
+    """Write one directory's index.html; returns False if it already had one."""
+    index_file = dir_path / "index.html"
+
+    # Skip if index.html already exists
+    if index_file.exists():
+        return False
+
+    # Calculate paths
+    rel_path = "/" + str(dir_path.relative_to(output_path))
+    depth = len(dir_path.relative_to(output_path).parts)
+    base_path = "../" * depth
+    adwaita_path = base_path + "adwaita.css"
+    css_path = base_path + "theme.css"
+    root_path = base_path or "./"
+
+    # Generate listing
+    listing_html = generate_listing_html(dir_path, output_path)
+
+    # Process template
+    values = {
+        "PATH": rel_path,
+        "ADWAITA_PATH": adwaita_path,
+        "CSS_PATH": css_path,
+        "ROOT_PATH": root_path,
+        "LISTING": listing_html,
+    }
+    html = _fill_template(template, values)
+
+    # Write file
+    with open(index_file, "w", encoding="utf-8") as f:
+        f.write(html)
+
+    return True
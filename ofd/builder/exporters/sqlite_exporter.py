@@ -6,11 +6,27 @@ dict-based entities with varying fields.
 """
 
 import lzma
+import shutil
 import sqlite3
 from pathlib import Path
 
 from ..models import Database
-from ..serialization import insert_entities
+from ..serialization import (
+    insert_entities,
+    parse_table_columns,
+    write_database_file,
+)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# The database is fed to the xz compressor in chunks of this size
+_COPY_CHUNK_SIZE = 1 << 20
+
+# zstd level 19 is close to xz's ratio and compresses on all cores
+_ZSTD_LEVEL = 19
 
 # =============================================================================
 # Schema DDL - Defines table structure, indexes, and views
@@ -36,8 +52,6 @@ CREATE TABLE IF NOT EXISTS brand (
     origin TEXT NOT NULL,
     source TEXT
 );
-CREATE INDEX IF NOT EXISTS ix_brand_name ON brand(name);
-CREATE INDEX IF NOT EXISTS ix_brand_uuid ON brand(uuid);
 
 -- Material table (at brand level)
 CREATE TABLE IF NOT EXISTS material (
@@ -50,9 +64,6 @@ CREATE TABLE IF NOT EXISTS material (
     default_max_dry_temperature INTEGER,
     default_slicer_settings TEXT  -- JSON
 );
-CREATE INDEX IF NOT EXISTS ix_material_brand ON material(brand_id);
-CREATE INDEX IF NOT EXISTS ix_material_type ON material(material);
-CREATE INDEX IF NOT EXISTS ix_material_uuid ON material(uuid);
 
 -- Filament table
 CREATE TABLE IF NOT EXISTS filament (
@@ -83,10 +94,6 @@ CREATE TABLE IF NOT EXISTS filament (
     discontinued INTEGER NOT NULL DEFAULT 0,
     slicer_settings TEXT  -- JSON
 );
-CREATE INDEX IF NOT EXISTS ix_filament_brand ON filament(brand_id);
-CREATE INDEX IF NOT EXISTS ix_filament_material ON filament(material_id);
-CREATE INDEX IF NOT EXISTS ix_filament_slug ON filament(slug);
-CREATE INDEX IF NOT EXISTS ix_filament_uuid ON filament(uuid);
 
 -- Variant table
 CREATE TABLE IF NOT EXISTS variant (
@@ -101,10 +108,6 @@ CREATE TABLE IF NOT EXISTS variant (
     traits TEXT,  -- JSON
     discontinued INTEGER NOT NULL DEFAULT 0
 );
-CREATE INDEX IF NOT EXISTS ix_variant_filament ON variant(filament_id);
-CREATE INDEX IF NOT EXISTS ix_variant_slug ON variant(slug);
-CREATE INDEX IF NOT EXISTS ix_variant_name ON variant(name);
-CREATE INDEX IF NOT EXISTS ix_variant_uuid ON variant(uuid);
 
 -- Size table (spool size/SKU)
 CREATE TABLE IF NOT EXISTS size (
@@ -122,10 +125,6 @@ CREATE TABLE IF NOT EXISTS size (
     qr_identifier TEXT,
     discontinued INTEGER NOT NULL DEFAULT 0
 );
-CREATE INDEX IF NOT EXISTS ix_size_variant ON size(variant_id);
-CREATE INDEX IF NOT EXISTS ix_size_gtin ON size(gtin);
-CREATE INDEX IF NOT EXISTS ix_size_weight ON size(filament_weight);
-CREATE INDEX IF NOT EXISTS ix_size_uuid ON size(uuid);
 
 -- Store table
 CREATE TABLE IF NOT EXISTS store (
@@ -138,8 +137,6 @@ CREATE TABLE IF NOT EXISTS store (
     ships_from TEXT NOT NULL,  -- JSON array
     ships_to TEXT NOT NULL  -- JSON array
 );
-CREATE INDEX IF NOT EXISTS ix_store_name ON store(name);
-CREATE INDEX IF NOT EXISTS ix_store_uuid ON store(uuid);
 
 -- Purchase link table
 CREATE TABLE IF NOT EXISTS purchase_link (
@@ -151,8 +148,6 @@ CREATE TABLE IF NOT EXISTS purchase_link (
     ships_from TEXT,  -- JSON array (override)
     ships_to TEXT  -- JSON array (override)
 );
-CREATE INDEX IF NOT EXISTS ix_purchase_link_size ON purchase_link(size_id);
-CREATE INDEX IF NOT EXISTS ix_purchase_link_store ON purchase_link(store_id);
 
 -- Useful views
 CREATE VIEW IF NOT EXISTS v_full_variant AS
@@ -220,6 +215,35 @@ JOIN filament f ON v.filament_id = f.id
 JOIN brand b ON f.brand_id = b.id;
 """
 
+# Insert column lists, taken from the DDL rather than queried per table
+TABLE_COLUMNS = parse_table_columns(SCHEMA_DDL)
+
+# Indexes are created after the bulk insert so they are built once, not
+# maintained row by row
+INDEX_DDL = """
+CREATE INDEX IF NOT EXISTS ix_brand_name ON brand(name);
+CREATE INDEX IF NOT EXISTS ix_brand_uuid ON brand(uuid);
+CREATE INDEX IF NOT EXISTS ix_material_brand ON material(brand_id);
+CREATE INDEX IF NOT EXISTS ix_material_type ON material(material);
+CREATE INDEX IF NOT EXISTS ix_material_uuid ON material(uuid);
+CREATE INDEX IF NOT EXISTS ix_filament_brand ON filament(brand_id);
+CREATE INDEX IF NOT EXISTS ix_filament_material ON filament(material_id);
+CREATE INDEX IF NOT EXISTS ix_filament_slug ON filament(slug);
+CREATE INDEX IF NOT EXISTS ix_filament_uuid ON filament(uuid);
+CREATE INDEX IF NOT EXISTS ix_variant_filament ON variant(filament_id);
+CREATE INDEX IF NOT EXISTS ix_variant_slug ON variant(slug);
+CREATE INDEX IF NOT EXISTS ix_variant_name ON variant(name);
+CREATE INDEX IF NOT EXISTS ix_variant_uuid ON variant(uuid);
+CREATE INDEX IF NOT EXISTS ix_size_variant ON size(variant_id);
+CREATE INDEX IF NOT EXISTS ix_size_gtin ON size(gtin);
+CREATE INDEX IF NOT EXISTS ix_size_weight ON size(filament_weight);
+CREATE INDEX IF NOT EXISTS ix_size_uuid ON size(uuid);
+CREATE INDEX IF NOT EXISTS ix_store_name ON store(name);
+CREATE INDEX IF NOT EXISTS ix_store_uuid ON store(uuid);
+CREATE INDEX IF NOT EXISTS ix_purchase_link_size ON purchase_link(size_id);
+CREATE INDEX IF NOT EXISTS ix_purchase_link_store ON purchase_link(store_id);
+"""
+
 
 # =============================================================================
 # Main Export Function
@@ -237,33 +261,46 @@ def export_sqlite(db: Database, output_dir: str, version: str, generated_at: str
     if db_path.exists():
         db_path.unlink()
 
-    # Create database
-    conn = sqlite3.connect(str(db_path))
+    # Build the database in memory (written to db_path in one pass below), with
+    # autocommit so the load transaction is opened and committed explicitly
+    conn = sqlite3.connect(":memory:", isolation_level=None)
     cursor = conn.cursor()
 
     # Create schema
     cursor.executescript(SCHEMA_DDL)
 
+    # Load everything in one explicit transaction
+    cursor.execute("BEGIN IMMEDIATE")
+
     # Insert metadata
     cursor.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("version", version))
     cursor.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("generated_at", generated_at))
 
-    # Insert all entities using PRAGMA-driven column matching
-    insert_entities(cursor, db.brands, "brand")
-    insert_entities(cursor, db.materials, "material")
-    insert_entities(cursor, db.filaments, "filament")
-    insert_entities(cursor, db.variants, "variant")
-    insert_entities(cursor, db.sizes, "size")
-    insert_entities(cursor, db.stores, "store")
-    insert_entities(cursor, db.purchase_links, "purchase_link")
+    # Insert all entities, matching dict keys to the DDL columns
+    insert_entities(cursor, db.brands, "brand", TABLE_COLUMNS["brand"])
+    insert_entities(cursor, db.materials, "material", TABLE_COLUMNS["material"])
+    insert_entities(cursor, db.filaments, "filament", TABLE_COLUMNS["filament"])
+    insert_entities(cursor, db.variants, "variant", TABLE_COLUMNS["variant"])
+    insert_entities(cursor, db.sizes, "size", TABLE_COLUMNS["size"])
+    insert_entities(cursor, db.stores, "store", TABLE_COLUMNS["store"])
+    insert_entities(cursor, db.purchase_links, "purchase_link", TABLE_COLUMNS["purchase_link"])
 
-    conn.commit()
+    cursor.execute("COMMIT")
+    cursor.executescript(INDEX_DDL)
+    write_database_file(conn, db_path)
     conn.close()
     print(f"  Written: {db_path}")
 
     # Create compressed version
     db_xz_path = output_path / "filaments.db.xz"
-    with open(db_path, "rb") as f_in:
-        with lzma.open(db_xz_path, "wb") as f_out:
-            f_out.write(f_in.read())
+    with open(db_path, "rb") as f_in, lzma.open(db_xz_path, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out, _COPY_CHUNK_SIZE)
     print(f"  Written: {db_xz_path}")
+
+    # Multithreaded zstd copy alongside the xz one, when zstandard is installed
+    if zstandard is not None:
+        db_zst_path = output_path / "filaments.db.zst"
+        cctx = zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1)
+        with open(db_path, "rb") as f_in, open(db_zst_path, "wb") as f_out:
+            cctx.copy_stream(f_in, f_out)
+        print(f"  Written: {db_zst_path}")
@@ -6,11 +6,27 @@ making it easier to work with store data independently.
 """
 
 import lzma
+import shutil
 import sqlite3
 from pathlib import Path
 
 from ..models import Database
-from ..serialization import insert_entities
+from ..serialization import (
+    insert_entities,
+    parse_table_columns,
+    write_database_file,
+)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# The database is fed to the xz compressor in chunks of this size
+_COPY_CHUNK_SIZE = 1 << 20
+
+# zstd level 19 is close to xz's ratio and compresses on all cores
+_ZSTD_LEVEL = 19
 
 # =============================================================================
 # Schema DDL - Stores database schema
@@ -36,9 +52,6 @@ CREATE TABLE IF NOT EXISTS store (
     ships_from TEXT NOT NULL,  -- JSON array
     ships_to TEXT NOT NULL  -- JSON array
 );
-CREATE INDEX IF NOT EXISTS ix_store_name ON store(name);
-CREATE INDEX IF NOT EXISTS ix_store_slug ON store(slug);
-CREATE INDEX IF NOT EXISTS ix_store_uuid ON store(uuid);
 
 -- Store shipping regions view (for easier querying)
 CREATE VIEW IF NOT EXISTS v_store_shipping AS
@@ -52,6 +65,17 @@ SELECT
 FROM store;
 """
 
+# Insert column lists, taken from the DDL rather than queried per table
+STORES_TABLE_COLUMNS = parse_table_columns(STORES_SCHEMA_DDL)
+
+# Indexes are created after the bulk insert so they are built once, not
+# maintained row by row
+STORES_INDEX_DDL = """
+CREATE INDEX IF NOT EXISTS ix_store_name ON store(name);
+CREATE INDEX IF NOT EXISTS ix_store_slug ON store(slug);
+CREATE INDEX IF NOT EXISTS ix_store_uuid ON store(uuid);
+"""
+
 
 # =============================================================================
 # Main Export Function
@@ -69,13 +93,17 @@ def export_sqlite_stores(db: Database, output_dir: str, version: str, generated_
     if db_path.exists():
         db_path.unlink()
 
-    # Create database
-    conn = sqlite3.connect(db_path)
+    # Build the database in memory (written to db_path in one pass below), with
+    # autocommit so the load transaction is opened and committed explicitly
+    conn = sqlite3.connect(":memory:", isolation_level=None)
     cursor = conn.cursor()
 
     # Create schema
     cursor.executescript(STORES_SCHEMA_DDL)
 
+    # Load everything in one explicit transaction
+    cursor.execute("BEGIN IMMEDIATE")
+
     # Insert metadata
     cursor.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("version", version))
     cursor.execute("INSERT INTO meta (key, value) VALUES (?, ?)", ("generated_at", generated_at))
@@ -83,16 +111,25 @@ def export_sqlite_stores(db: Database, output_dir: str, version: str, generated_
         "INSERT INTO meta (key, value) VALUES (?, ?)", ("store_count", str(len(db.stores)))
     )
 
-    # Insert stores using PRAGMA-driven column matching
-    insert_entities(cursor, db.stores, "store")
+    # Insert stores, matching dict keys to the DDL columns
+    insert_entities(cursor, db.stores, "store", STORES_TABLE_COLUMNS["store"])
 
-    conn.commit()
+    cursor.execute("COMMIT")
+    cursor.executescript(STORES_INDEX_DDL)
+    write_database_file(conn, db_path)
     conn.close()
     print(f"  Written: {db_path} ({len(db.stores)} stores)")
 
     # Create compressed version
     db_xz_path = output_path / "stores.db.xz"
-    with open(db_path, "rb") as f_in:
-        with lzma.open(db_xz_path, "wb") as f_out:
-            f_out.write(f_in.read())
+    with open(db_path, "rb") as f_in, lzma.open(db_xz_path, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out, _COPY_CHUNK_SIZE)
     print(f"  Written: {db_xz_path}")
+
+    # Multithreaded zstd copy alongside the xz one, when zstandard is installed
+    if zstandard is not None:
+        db_zst_path = output_path / "stores.db.zst"
+        cctx = zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1)
+        with open(db_path, "rb") as f_in, open(db_zst_path, "wb") as f_out:
+            cctx.copy_stream(f_in, f_out)
+        print(f"  Written: {db_zst_path}")
@@ -33,44 +33,51 @@ class Database:
     stores: list[dict] = field(default_factory=list)
     purchase_links: list[dict] = field(default_factory=list)
 
+    # Lazily built id -> entity maps behind the get_* methods, keyed by list
+    # attribute name. Each records the list and length it was built from, so
+    # appending to or replacing a list rebuilds it on the next lookup.
+    _indexes: dict[str, tuple[list[dict], int, dict[str, dict]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def get_brand(self, brand_id: str) -> dict | None:
         """Get brand by ID."""
-        for brand in self.brands:
-            if brand["id"] == brand_id:
-                return brand
-        return None
+        return self._lookup("brands", brand_id)
 
     def get_material(self, material_id: str) -> dict | None:
         """Get material by ID."""
-        for material in self.materials:
-            if material["id"] == material_id:
-                return material
-        return None
+        return self._lookup("materials", material_id)
 
     def get_filament(self, filament_id: str) -> dict | None:
         """Get filament by ID."""
-        for filament in self.filaments:
-            if filament["id"] == filament_id:
-                return filament
-        return None
+        return self._lookup("filaments", filament_id)
 
     def get_variant(self, variant_id: str) -> dict | None:
         """Get variant by ID."""
-        for variant in self.variants:
-            if variant["id"] == variant_id:
-                return variant
-        return None
+        return self._lookup("variants", variant_id)
 
     def get_size(self, size_id: str) -> dict | None:
         """Get size by ID."""
-        for size in self.sizes:
-            if size["id"] == size_id:
-                return size
-        return None
+        return self._lookup("sizes", size_id)
 
     def get_store(self, store_id: str) -> dict | None:
         """Get store by ID."""
-        for store in self.stores:
-            if store["id"] == store_id:
-                return store
-        return None
+        return self._lookup("stores", store_id)
+
+    def reindex(self) -> None:
+        """Drop the id lookup indexes so the next get_* calls rebuild them.
+
+        Appends and list replacements are picked up automatically; call this
+        after changing the id of an entity already in a list, or removing one
+        and adding another in its place.
+        """
+        self._indexes.clear()
+
+    def _lookup(self, name: str, entity_id: str) -> dict | None:
+        entities = getattr(self, name)
+        cached = self._indexes.get(name)
+        if cached is None or cached[0] is not entities or cached[1] != len(entities):
+            # Reversed so the first entity with a given id wins, as with a linear scan
+            index = {entity["id"]: entity for entity in reversed(entities)}
+            self._indexes[name] = cached = (entities, len(entities), index)
+        return cached[2].get(entity_id)
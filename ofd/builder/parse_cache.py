@@ -0,0 +1,69 @@
+"""
+Content-addressed cache of parsed files, shared across runs.
+
+Used by the OpenPrintTag importer to skip re-parsing unchanged YAML. The build
+crawler does not use it: its JSON files are small enough that hashing and
+unpickling cost more than parsing them again.
+
+Entries are keyed by the SHA-256 of the file bytes, so an edited file always
+misses while renamed or moved files keep hitting. Each entry is the pickled
+parse result stored at <cache_dir>/<hash[:2]>/<hash><suffix>, where the
+suffix keeps parses by different loaders apart.
+
+Security: entries are read back with pickle.load, which can run arbitrary
+code. The cache directory must be trusted — only ever point it at a private
+directory written by these tools (e.g. under .cache/), never at a shared,
+downloaded or otherwise untrusted location. Pickle is kept (rather than JSON or
+marshal) because it round-trips every parsed value, including YAML dates, at a
+fraction of the cost of re-parsing.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+
+def load_cached(
+    path: str | Path, cache_dir: str | Path, parse: Callable[[bytes], object], suffix: str = ".pkl"
+):
+    """Parse a file's bytes with *parse*, reusing a cached result for identical content.
+
+    Callers sharing a *cache_dir* pass a distinct *suffix* per loader. Raises
+    whatever reading the file or *parse* raises; unreadable or corrupt cache
+    entries are treated as misses. *cache_dir* must be trusted, since cache
+    entries are unpickled (see module docstring).
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    digest = hashlib.sha256(data).hexdigest()
+    entry = Path(cache_dir) / digest[:2] / f"{digest}{suffix}"
+
+    try:
+        with open(entry, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    parsed = parse(data)
+    _write_entry(entry, parsed)
+    return parsed
+
+
+def _write_entry(entry: Path, parsed) -> None:
+    """Atomically write a cache entry; failures only cost a future re-parse."""
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
@@ -4,11 +4,13 @@ Shared serialization utilities for the Open Filament Database builder.
 Works with plain dict entities — no dataclass introspection needed.
 """
 
-import json
+import re
 import sqlite3
+from pathlib import Path
 from typing import Any
 
 from ofd.builder.models import ENTITY_TYPES
+from ofd.builder.utils import dumps_json
 
 
 def entity_to_dict(entity: Any, exclude_none: bool = True) -> dict | None:
@@ -24,24 +26,19 @@ def entity_to_dict(entity: Any, exclude_none: bool = True) -> dict | None:
     if not isinstance(entity, dict):
         return entity
 
-    # Detect brand/store by presence of directory_name (only those entity types have it)
-    is_brand_or_store = "directory_name" in entity
+    # Plain entities only need None-stripping
+    if "directory_name" not in entity:
+        if exclude_none:
+            return {key: value for key, value in entity.items() if value is not None}
+        return dict(entity)
 
-    result = {}
-    for key, value in entity.items():
-        # Skip internal-only field
-        if key == "directory_name":
-            continue
-
-        # Rename logo -> logo_name for brands and stores
-        output_key = key
-        if key == "logo" and is_brand_or_store:
-            output_key = "logo_name"
-
-        if value is not None or not exclude_none:
-            result[output_key] = value
-
-    return result
+    # Brands and stores (the only types with directory_name): drop the internal
+    # field and rename logo -> logo_name
+    return {
+        ("logo_name" if key == "logo" else key): value
+        for key, value in entity.items()
+        if key != "directory_name" and (value is not None or not exclude_none)
+    }
 
 
 def serialize_for_csv(value: Any) -> str:
@@ -51,7 +48,7 @@ def serialize_for_csv(value: Any) -> str:
     if isinstance(value, bool):
         return "1" if value else "0"
     if isinstance(value, (dict, list)):
-        return json.dumps(value, ensure_ascii=False)
+        return dumps_json(value)
     return str(value)
 
 
@@ -62,10 +59,72 @@ def serialize_for_sqlite(value: Any) -> Any:
     if isinstance(value, bool):
         return 1 if value else 0
     if isinstance(value, (dict, list)):
-        return json.dumps(value, ensure_ascii=False)
+        return dumps_json(value)
     return value
 
 
+# Settings for the on-disk copy of a database built in memory. The file is a
+# fresh build output, so a rollback journal and fsyncs buy nothing.
+_BACKUP_TARGET_PRAGMAS = """
+PRAGMA journal_mode = OFF;
+PRAGMA synchronous = OFF;
+"""
+
+
+_CREATE_TABLE_RE = re.compile(r"CREATE TABLE IF NOT EXISTS (\w+)\s*\((.*?)\n\);", re.DOTALL)
+# Leading keywords of table constraints, which are not column definitions
+_TABLE_CONSTRAINT_KEYWORDS = {"CONSTRAINT", "PRIMARY", "FOREIGN", "UNIQUE", "CHECK"}
+
+
+def parse_table_columns(ddl: str) -> dict[str, tuple[str, ...]]:
+    """
+    Get the column names of every CREATE TABLE in a schema script.
+
+    Exporters compute this once from their DDL at import, so inserts don't
+    need a PRAGMA table_info round-trip per table. Expects the layout used by
+    the schemas in this package: one column definition per line.
+    """
+    tables = {}
+    for table_name, body in _CREATE_TABLE_RE.findall(ddl):
+        columns = []
+        for line in body.splitlines():
+            definition = line.split("--", 1)[0].strip()
+            if not definition:
+                continue
+            name = definition.split(None, 1)[0]
+            if name.upper() not in _TABLE_CONSTRAINT_KEYWORDS:
+                columns.append(name)
+        tables[table_name] = tuple(columns)
+    return tables
+
+
+# Value types sqlite3 binds directly with the same result as serialize_for_sqlite
+_SQLITE_NATIVE_TYPES = {str, int, float, bool, type(None)}
+
+
+def _serialize_sqlite_column(values: list) -> list:
+    """Serialize one column for SQLite, specializing on the value types it contains.
+
+    Columns holding only scalars bind as-is: sqlite3 stores bools as the
+    integers 1/0 itself, exactly as serialize_for_sqlite would. Only columns
+    containing lists or dicts go through serialize_for_sqlite per value.
+    """
+    types = set(map(type, values))
+    if types <= _SQLITE_NATIVE_TYPES:
+        return values
+    return [serialize_for_sqlite(v) for v in values]
+
+
+def write_database_file(conn: sqlite3.Connection, db_path: Path) -> None:
+    """Copy a database built in memory to db_path in one pass with the backup API."""
+    disk = sqlite3.connect(db_path)
+    try:
+        disk.executescript(_BACKUP_TARGET_PRAGMAS)
+        conn.backup(disk)
+    finally:
+        disk.close()
+
+
 def get_table_columns(cursor: sqlite3.Cursor, table_name: str) -> list[str]:
     """Get column names for a table from the SQLite schema."""
     if table_name not in ENTITY_TYPES:
@@ -78,13 +137,15 @@ def insert_entities(
     cursor: sqlite3.Cursor,
     entities: list[dict],
     table_name: str,
+    columns: tuple[str, ...] | None = None,
 ):
     """
     Insert dict entities into SQLite, matching dict keys to table columns.
 
     Columns in the DDL that don't exist in the entity get NULL.
     Fields in the entity that don't exist in the DDL are silently skipped
-    (they still appear in JSON/CSV/API exports).
+    (they still appear in JSON/CSV/API exports). Pass ``columns`` (see
+    parse_table_columns) to skip looking them up with PRAGMA table_info.
     """
     if not entities:
         return
@@ -92,12 +153,14 @@ def insert_entities(
     if table_name not in ENTITY_TYPES:
         raise ValueError(f"Unknown table name: {table_name}")
 
-    columns = get_table_columns(cursor, table_name)
+    if columns is None:
+        columns = get_table_columns(cursor, table_name)
     placeholders = ", ".join(["?"] * len(columns))
     col_names = ", ".join(columns)
     sql = f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders})"
 
-    for entity in entities:
-        exported = entity_to_dict(entity)
-        values = tuple(serialize_for_sqlite(exported.get(col)) for col in columns)
-        cursor.execute(sql, values)
+    # Serialize column by column, then zip the columns back into rows for one
+    # executemany call, which reuses the prepared statement for every row
+    exported = [entity_to_dict(entity) for entity in entities]
+    values = [_serialize_sqlite_column([row.get(col) for row in exported]) for col in columns]
+    cursor.executemany(sql, zip(*values, strict=True))
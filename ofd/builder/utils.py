@@ -7,11 +7,19 @@ UUID Generation follows the OFD standard specification:
 - Derivation uses binary concatenation of parent UUIDs + UTF-8 encoded strings
 """
 
+import functools
 import hashlib
+import json
 import re
 import subprocess
 import uuid
 from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # =============================================================================
 # UUID Namespaces (from OPT specification)
@@ -33,15 +41,32 @@ NAMESPACE_SIZE = uuid.UUID("c3d4e5f6-a7b8-6c7d-0e1f-2a3b4c5d6e7f")
 NAMESPACE_STORE = uuid.UUID("d4e5f6a7-b8c9-7d8e-1f2a-3b4c5d6e7f8a")
 NAMESPACE_PURCHASE_LINK = uuid.UUID("e5f6a7b8-c9d0-8e9f-2a3b-4c5d6e7f8a9b")
 
+# UUID.bytes is recomputed from the integer on every access, so the binary form
+# of each namespace is encoded once here for the derivation hot path.
+_NAMESPACE_BYTES = {
+    namespace: namespace.bytes
+    for namespace in (
+        NAMESPACE_BRAND,
+        NAMESPACE_MATERIAL,
+        NAMESPACE_PACKAGE,
+        NAMESPACE_INSTANCE,
+        NAMESPACE_FILAMENT,
+        NAMESPACE_VARIANT,
+        NAMESPACE_SIZE,
+        NAMESPACE_STORE,
+        NAMESPACE_PURCHASE_LINK,
+    )
+}
+
 
 # =============================================================================
 # Core UUID Generation (OFD Standard)
 # =============================================================================
 
 
-def _derive_uuid(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> uuid.UUID:
+def _derive_uuid_bytes(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> bytes:
     """
-    Derive a UUID using the OFD standard algorithm.
+    Derive the 16 raw bytes of a UUID using the OFD standard algorithm.
 
     Uses UUIDv5 with SHA1 hash as specified in RFC 4122, section 4.3.
 
@@ -53,10 +78,10 @@ def _derive_uuid(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> uuid.U
             - uuid.UUID: Used as bytes (binary form)
 
     Returns:
-        Derived UUID
+        The derived UUID's bytes, with version and variant bits set
     """
     # Build the name by concatenating all args
-    parts = []
+    parts = [_NAMESPACE_BYTES.get(namespace) or namespace.bytes]
     for arg in args:
         if isinstance(arg, bytes):
             parts.append(arg)
@@ -68,11 +93,43 @@ def _derive_uuid(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> uuid.U
             # Convert to string and encode
             parts.append(str(arg).encode("utf-8"))
 
-    name = b"".join(parts)
     # uuid.uuid5 expects a string, but we have bytes from concatenation
     # We need to use the underlying implementation directly
-    hash_value = hashlib.sha1(namespace.bytes + name).digest()
-    return uuid.UUID(bytes=hash_value[:16], version=5)
+    digest = bytearray(hashlib.sha1(b"".join(parts)).digest()[:16])
+    digest[6] = (digest[6] & 0x0F) | 0x50  # version 5
+    digest[8] = (digest[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return bytes(digest)
+
+
+def _derive_uuid(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> uuid.UUID:
+    """Derive a UUID using the OFD standard algorithm (see _derive_uuid_bytes)."""
+    return uuid.UUID(bytes=_derive_uuid_bytes(namespace, *args))
+
+
+def _derive_uuid_str(namespace: uuid.UUID, *args: bytes | str | uuid.UUID) -> str:
+    """Derive a UUID string, formatting the bytes directly without a uuid.UUID."""
+    h = _derive_uuid_bytes(namespace, *args).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _uuid_bytes(value: str | uuid.UUID) -> bytes:
+    """Binary form of a parent UUID given as a uuid.UUID or a string.
+
+    Canonical "xxxxxxxx-xxxx-..." strings are decoded with bytes.fromhex, which
+    is much cheaper than constructing a uuid.UUID; other spellings fall back to
+    uuid.UUID parsing (and its ValueError for malformed input). fromhex skips
+    whitespace, so the fast path also requires exactly 16 decoded bytes.
+    """
+    if isinstance(value, uuid.UUID):
+        return value.bytes
+    if len(value) == 36 and value[8] == value[13] == value[18] == value[23] == "-":
+        try:
+            raw = bytes.fromhex(value.replace("-", ""))
+        except ValueError:
+            raw = b""
+        if len(raw) == 16:
+            return raw
+    return uuid.UUID(value).bytes
 
 
 def generate_brand_uuid(brand_name: str) -> str:
@@ -85,7 +142,7 @@ def generate_brand_uuid(brand_name: str) -> str:
         >>> generate_brand_uuid("Prusament")
         'ae5ff34e-298e-50c9-8f77-92a97fb30b09'
     """
-    return str(_derive_uuid(NAMESPACE_BRAND, brand_name))
+    return _derive_uuid_str(NAMESPACE_BRAND, brand_name)
 
 
 def generate_material_uuid(brand_uuid: str | uuid.UUID, material_name: str) -> str:
@@ -99,9 +156,7 @@ def generate_material_uuid(brand_uuid: str | uuid.UUID, material_name: str) -> s
         >>> generate_material_uuid(brand_uuid, "PLA Prusa Galaxy Black")
         '1aaca54a-431f-5601-adf5-85dd018f487f'
     """
-    if isinstance(brand_uuid, str):
-        brand_uuid = uuid.UUID(brand_uuid)
-    return str(_derive_uuid(NAMESPACE_MATERIAL, brand_uuid, material_name))
+    return _derive_uuid_str(NAMESPACE_MATERIAL, _uuid_bytes(brand_uuid), material_name)
 
 
 def generate_package_uuid(brand_uuid: str | uuid.UUID, gtin: str) -> str:
@@ -115,9 +170,7 @@ def generate_package_uuid(brand_uuid: str | uuid.UUID, gtin: str) -> str:
         >>> generate_package_uuid(brand_uuid, "1234")
         '7ed3ce83-764d-56de-bdcd-dc5226a0efd1'
     """
-    if isinstance(brand_uuid, str):
-        brand_uuid = uuid.UUID(brand_uuid)
-    return str(_derive_uuid(NAMESPACE_PACKAGE, brand_uuid, gtin))
+    return _derive_uuid_str(NAMESPACE_PACKAGE, _uuid_bytes(brand_uuid), gtin)
 
 
 def generate_instance_uuid(nfc_tag_uid: bytes) -> str:
@@ -134,7 +187,7 @@ def generate_instance_uuid(nfc_tag_uid: bytes) -> str:
         >>> generate_instance_uuid(nfc_tag_uid)
         'bf63e92d-9ca5-53d7-9fab-ffdd0240c585'
     """
-    return str(_derive_uuid(NAMESPACE_INSTANCE, nfc_tag_uid))
+    return _derive_uuid_str(NAMESPACE_INSTANCE, nfc_tag_uid)
 
 
 # =============================================================================
@@ -142,11 +195,13 @@ def generate_instance_uuid(nfc_tag_uid: bytes) -> str:
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=4096)
 def generate_brand_id(name: str) -> str:
     """Generate a stable ID for a brand using the OFD standard algorithm."""
     return generate_brand_uuid(name)
 
 
+@functools.lru_cache(maxsize=4096)
 def generate_material_id(brand_id: str, material: str) -> str:
     """
     Generate a stable ID for a material (at brand level).
@@ -162,9 +217,9 @@ def generate_filament_id(brand_id: str, material_id: str, filament_name: str) ->
 
     Formula: NAMESPACE_FILAMENT + brand_uuid (bytes) + material_uuid (bytes) + filament_name (UTF-8)
     """
-    brand_uuid = uuid.UUID(brand_id)
-    material_uuid = uuid.UUID(material_id)
-    return str(_derive_uuid(NAMESPACE_FILAMENT, brand_uuid, material_uuid, filament_name))
+    return _derive_uuid_str(
+        NAMESPACE_FILAMENT, _uuid_bytes(brand_id), _uuid_bytes(material_id), filament_name
+    )
 
 
 def generate_variant_id(filament_id: str, color_name: str) -> str:
@@ -173,8 +228,7 @@ def generate_variant_id(filament_id: str, color_name: str) -> str:
 
     Formula: NAMESPACE_VARIANT + filament_uuid (bytes) + color_name (UTF-8)
     """
-    filament_uuid = uuid.UUID(filament_id)
-    return str(_derive_uuid(NAMESPACE_VARIANT, filament_uuid, color_name))
+    return _derive_uuid_str(NAMESPACE_VARIANT, _uuid_bytes(filament_id), color_name)
 
 
 def generate_size_id(variant_id: str, size_entry: dict, index: int = 0) -> str:
@@ -194,7 +248,6 @@ def generate_size_id(variant_id: str, size_entry: dict, index: int = 0) -> str:
     """
     weight = size_entry.get("filament_weight")
     diameter = size_entry.get("diameter", 1.75)
-    variant_uuid = uuid.UUID(variant_id)
 
     # Build ID components from multiple distinguishing fields
     id_parts = [f"{weight}g", f"{diameter}mm"]
@@ -218,7 +271,7 @@ def generate_size_id(variant_id: str, size_entry: dict, index: int = 0) -> str:
 
     # Join all parts with underscores
     id_str = "_".join(id_parts)
-    return str(_derive_uuid(NAMESPACE_SIZE, variant_uuid, id_str))
+    return _derive_uuid_str(NAMESPACE_SIZE, _uuid_bytes(variant_id), id_str)
 
 
 def generate_store_id(store_slug: str) -> str:
@@ -227,7 +280,7 @@ def generate_store_id(store_slug: str) -> str:
 
     Formula: NAMESPACE_STORE + store_slug (UTF-8)
     """
-    return str(_derive_uuid(NAMESPACE_STORE, store_slug))
+    return _derive_uuid_str(NAMESPACE_STORE, store_slug)
 
 
 def generate_purchase_link_id(size_id: str, store_id: str, url: str) -> str:
@@ -236,9 +289,9 @@ def generate_purchase_link_id(size_id: str, store_id: str, url: str) -> str:
 
     Formula: NAMESPACE_PURCHASE_LINK + size_uuid (bytes) + store_uuid (bytes) + url (UTF-8)
     """
-    size_uuid = uuid.UUID(size_id)
-    store_uuid = uuid.UUID(store_id)
-    return str(_derive_uuid(NAMESPACE_PURCHASE_LINK, size_uuid, store_uuid, url))
+    return _derive_uuid_str(
+        NAMESPACE_PURCHASE_LINK, _uuid_bytes(size_id), _uuid_bytes(store_id), url
+    )
 
 
 # =============================================================================
@@ -263,54 +316,68 @@ def generate_canonical_uuid() -> str:
 # =============================================================================
 
 
+_SEPARATOR_RUN_RE = re.compile(r"[\s\-]+")
+_NON_SLUG_CHAR_RE = re.compile(r"[^a-z0-9_+]")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+
+@functools.lru_cache(maxsize=8192)
 def slugify(text: str) -> str:
     """Convert text to a slug that matches the schema id pattern: ^[a-z0-9+]+(_[a-z0-9+]+)*$
 
     Uses underscores as separators to stay consistent with on-disk directory
-    names and the JSON schema id constraints.
+    names and the JSON schema id constraints. Results are memoized since the
+    same ids recur across brands, materials and variants.
     """
     # Convert to lowercase
     text = text.lower()
     # Replace spaces and hyphens with underscores
-    text = re.sub(r"[\s\-]+", "_", text)
+    text = _SEPARATOR_RUN_RE.sub("_", text)
     # Remove non-alphanumeric characters except underscores and plus
-    text = re.sub(r"[^a-z0-9_+]", "", text)
+    text = _NON_SLUG_CHAR_RE.sub("", text)
     # Remove consecutive underscores
-    text = re.sub(r"_+", "_", text)
+    text = _UNDERSCORE_RUN_RE.sub("_", text)
     # Strip leading/trailing underscores
     text = text.strip("_")
     return text
 
 
+_NORMALIZED_HEX_RE = re.compile(r"#[0-9A-F]{6}").fullmatch
+_HEX6_RE = re.compile(r"#?([0-9A-Fa-f]{6})").fullmatch
+_HEX3_RE = re.compile(r"#?([0-9A-Fa-f])([0-9A-Fa-f])([0-9A-Fa-f])").fullmatch
+
+
 def normalize_color_hex(color: str) -> str | None:
     """Normalize a color value to #RRGGBB format."""
     if not color:
         return None
 
+    # Already-normalized values skip the cache lookup entirely
+    if isinstance(color, str) and _NORMALIZED_HEX_RE(color):
+        return color
+
     # Handle arrays - take first value
     if isinstance(color, list):
-        if not color:
-            return None
         color = color[0]
 
-    # Remove any whitespace
-    color = str(color).strip()
+    return _normalize_color_hex(str(color))
 
-    # If already in correct format, return as-is
-    if re.match(r"^#[0-9A-Fa-f]{6}$", color):
-        return color.upper()
 
-    # Handle 3-digit hex
-    if re.match(r"^#[0-9A-Fa-f]{3}$", color):
-        r, g, b = color[1], color[2], color[3]
-        return f"#{r}{r}{g}{g}{b}{b}".upper()
+@functools.lru_cache(maxsize=4096)
+def _normalize_color_hex(color: str) -> str:
+    """Memoized string path of normalize_color_hex; hex values repeat heavily."""
+    # Remove any whitespace
+    color = color.strip()
 
-    # Handle hex without #
-    if re.match(r"^[0-9A-Fa-f]{6}$", color):
-        return f"#{color}".upper()
+    # 6-digit hex, with or without #
+    match = _HEX6_RE(color)
+    if match:
+        return f"#{match[1]}".upper()
 
-    if re.match(r"^[0-9A-Fa-f]{3}$", color):
-        r, g, b = color[0], color[1], color[2]
+    # 3-digit hex, with or without #
+    match = _HEX3_RE(color)
+    if match:
+        r, g, b = match.groups()
         return f"#{r}{r}{g}{g}{b}{b}".upper()
 
     # Return as-is if we can't parse it
@@ -353,6 +420,49 @@ def calculate_file_sha256(filepath: str) -> str:
         return hashlib.sha256(f.read()).hexdigest()
 
 
+# =============================================================================
+# JSON Utilities
+# =============================================================================
+
+
+def loads_json(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Compact stdlib encoder, used when orjson is missing or rejects a value
+_encode_json_compact = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), check_circular=False
+).encode
+
+
+def dumps_json(value) -> str:
+    """Serialize to compact JSON text without ASCII escaping, using orjson when installed.
+
+    Values orjson rejects (e.g. integers beyond 64 bits) fall back to the stdlib
+    encoder. Both produce the same text apart from exponent spelling of very
+    large or small floats (1e-7 vs 1e-07), which parse to the same value.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return _encode_json_compact(value)
+
+
+def load_json(path: str | Path):
+    """Load a JSON file, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+    the stdlib exception regardless of which parser ran.
+    """
+    with open(path, "rb") as f:
+        return loads_json(f.read())
+
+
 # =============================================================================
 # Collection Utilities
 # =============================================================================
@@ -12,21 +12,6 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-from ofd.builder.crawler import crawl_data
-from ofd.builder.errors import BuildResult
-from ofd.builder.exporters import (
-    export_api,
-    export_badges,
-    export_csv,
-    export_directory_listings,
-    export_html,
-    export_json,
-    export_sqlite,
-    export_sqlite_stores,
-    export_uuid_index,
-)
-from ofd.builder.utils import get_current_timestamp, get_git_commit
-
 project_root = Path(__file__).parent.parent.parent
 
 
@@ -130,6 +115,22 @@ def run_build(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for errors)
     """
+    # Imported here so other subcommands don't pay for loading the builder
+    from ofd.builder.crawler import crawl_data
+    from ofd.builder.errors import BuildResult
+    from ofd.builder.exporters import (
+        export_api,
+        export_badges,
+        export_csv,
+        export_directory_listings,
+        export_html,
+        export_json,
+        export_sqlite,
+        export_sqlite_stores,
+        export_uuid_index,
+    )
+    from ofd.builder.utils import get_current_timestamp, get_git_commit
+
     # Resolve paths
     data_dir = project_root / args.data_dir
     stores_dir = project_root / args.stores_dir
@@ -6,33 +6,37 @@ with CORS headers enabled for local development.
 """
 
 import argparse
-import http.server
-import socketserver
 import sys
 from pathlib import Path
 
 
-class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
-    """HTTP request handler with CORS headers enabled."""
+def _cors_handler_class():
+    """Build the CORS request handler; http.server is imported only when serving."""
+    import http.server
 
-    def end_headers(self):
-        # Add CORS headers to allow requests from any origin
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        # Add cache control for development
-        self.send_header("Cache-Control", "no-store, no-cache, must-revalidate")
-        super().end_headers()
+    class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
+        """HTTP request handler with CORS headers enabled."""
 
-    def do_OPTIONS(self):
-        """Handle OPTIONS requests for CORS preflight."""
-        self.send_response(200)
-        self.end_headers()
+        def end_headers(self):
+            # Add CORS headers to allow requests from any origin
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
+            self.send_header("Access-Control-Allow-Headers", "Content-Type")
+            # Add cache control for development
+            self.send_header("Cache-Control", "no-store, no-cache, must-revalidate")
+            super().end_headers()
 
-    def log_message(self, format, *args):
-        """Override to customize logging format."""
-        # Show path without the directory prefix for cleaner logs
-        print(f"[{self.log_date_time_string()}] {format % args}")
+        def do_OPTIONS(self):
+            """Handle OPTIONS requests for CORS preflight."""
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            """Override to customize logging format."""
+            # Show path without the directory prefix for cleaner logs
+            print(f"[{self.log_date_time_string()}] {format % args}")
+
+    return CORSRequestHandler
 
 
 def register_subcommand(subparsers: argparse._SubParsersAction) -> None:
@@ -73,6 +77,7 @@ def run_serve(args: argparse.Namespace) -> int:
         Exit code (0 for success, 1 for errors)
     """
     import errno
+    import socketserver
 
     # Resolve directory path
     project_root = Path(__file__).parent.parent.parent
@@ -88,6 +93,8 @@ def run_serve(args: argparse.Namespace) -> int:
     serve_dir = serve_dir.resolve()
 
     # Create request handler with specified directory
+    CORSRequestHandler = _cors_handler_class()
+
     def handler(*handler_args, **handler_kwargs):
         return CORSRequestHandler(*handler_args, directory=str(serve_dir), **handler_kwargs)
 
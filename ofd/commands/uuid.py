@@ -25,18 +25,8 @@ import json
 import sys
 from pathlib import Path
 
-from ofd.uuids import (
-    UUID_RE,
-    generate_canonical_uuid,
-    iter_entities,
-    resolve_uuid,
-    save_container,
-)
-from ofd.uuids import (
-    assign_uuid as _assign_uuid,
-)
-
 # Project root for resolving relative paths (ofd/commands/uuid.py -> repo root).
+# ofd.uuids loads the builder package, so the run_* handlers import it on demand.
 project_root = Path(__file__).parent.parent.parent
 
 
@@ -152,6 +142,8 @@ def _resolve_dirs(args: argparse.Namespace) -> tuple[Path, Path] | None:
 
 def run_new(args: argparse.Namespace) -> int:
     """Print one or more fresh canonical UUIDs."""
+    from ofd.uuids import generate_canonical_uuid
+
     count = max(1, args.count)
     uuids = [generate_canonical_uuid() for _ in range(count)]
     if getattr(args, "json", False):
@@ -164,6 +156,9 @@ def run_new(args: argparse.Namespace) -> int:
 
 def run_assign(args: argparse.Namespace) -> int:
     """Assign a UUID to every entity missing one, or (with --check) just report them."""
+    from ofd.uuids import assign_uuid as _assign_uuid
+    from ofd.uuids import generate_canonical_uuid, iter_entities, save_container
+
     dirs = _resolve_dirs(args)
     if dirs is None:
         return 1
@@ -245,6 +240,8 @@ def run_find(args: argparse.Namespace) -> int:
     ``moved_from``, so a former (now-deleted) UUID redirects to the entity that
     superseded it — this is how a consumer turns a dangling old UUID into a live one.
     """
+    from ofd.uuids import iter_entities, resolve_uuid
+
     dirs = _resolve_dirs(args)
     if dirs is None:
         return 1
@@ -289,6 +286,8 @@ def run_check(args: argparse.Namespace) -> int:
     Presence is required by default; ``--allow-missing-uuids`` relaxes only that.
     Malformed/duplicate UUIDs and unparseable files always fail.
     """
+    from ofd.uuids import UUID_RE, iter_entities
+
     dirs = _resolve_dirs(args)
     if dirs is None:
         return 1
@@ -453,6 +452,8 @@ def run_check(args: argparse.Namespace) -> int:
 
 def run_list(args: argparse.Namespace) -> int:
     """Print the uuid -> path index for every assigned entity."""
+    from ofd.uuids import iter_entities
+
     dirs = _resolve_dirs(args)
     if dirs is None:
         return 1
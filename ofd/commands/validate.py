@@ -6,9 +6,12 @@ including JSON schema validation, logo validation, folder name checks, and more.
 """
 
 import argparse
+import io
 import json
 import os
 import sys
+from collections import defaultdict
+from collections.abc import Callable
 from pathlib import Path
 
 from ofd.validation import (
@@ -24,32 +27,24 @@ project_root = Path(__file__).parent.parent.parent
 _color = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
 
 
-def _c(code: str, text: str) -> str:
-    return f"\033[{code}m{text}\033[0m" if _color else text
+def _style(code: str) -> Callable[[str], str]:
+    """Build a helper that wraps text in an ANSI code; with color off it is just str."""
+    if not _color:
+        return str
+    prefix = f"\033[{code}m"
 
+    def wrap(t: str) -> str:
+        return prefix + t + "\033[0m"
 
-def _red(t: str) -> str:
-    return _c("31", t)
+    return wrap
 
 
-def _green(t: str) -> str:
-    return _c("32", t)
-
-
-def _yellow(t: str) -> str:
-    return _c("33", t)
-
-
-def _cyan(t: str) -> str:
-    return _c("36", t)
-
-
-def _bold(t: str) -> str:
-    return _c("1", t)
-
-
-def _dim(t: str) -> str:
-    return _c("2", t)
+_red = _style("31")
+_green = _style("32")
+_yellow = _style("33")
+_cyan = _style("36")
+_bold = _style("1")
+_dim = _style("2")
 
 
 def register_subcommand(subparsers: argparse._SubParsersAction) -> None:
@@ -66,6 +61,7 @@ Examples:
   ofd validate --json-files    Only validate JSON schema compliance
   ofd validate --json          Output results as JSON
   ofd validate --progress      Emit progress events for SSE
+  ofd validate --max-workers 2 Cap validator parallelism
         """,
     )
 
@@ -107,6 +103,12 @@ Examples:
     dir_group.add_argument(
         "--stores-dir", default="stores", help="Stores directory (default: stores)"
     )
+    dir_group.add_argument(
+        "--max-workers",
+        type=int,
+        metavar="N",
+        help="Worker threads used by the validator (default: CPU count)",
+    )
 
     # Changes overlay options
     changes_group = parser.add_argument_group("changes overlay")
@@ -145,7 +147,7 @@ def run_validate(args: argparse.Namespace) -> int:
     orchestrator = ValidationOrchestrator(
         data_dir=data_dir,
         stores_dir=stores_dir,
-        max_workers=os.cpu_count(),
+        max_workers=args.max_workers or os.cpu_count(),
         progress_mode=args.progress,
     )
 
@@ -217,33 +219,45 @@ def run_validate(args: argparse.Namespace) -> int:
             print(json.dumps(output, indent=2))
         return 0 if result.is_valid else 1
 
-    # Text output mode — print all findings, but only fail on errors
+    # Clean run: nothing to group or summarize
+    if result.is_valid and not result.warning_count:
+        print(f"\n{_green('+')} All validations passed!")
+        return 0
+
+    # Text output mode — print all findings, but only fail on errors. The report is
+    # buffered and written once; large failing runs produce thousands of lines.
+    out = io.StringIO()
     if result.errors:
         # Group errors by category
-        errors_by_category: dict[str, list[ValidationError]] = {}
+        errors_by_category: defaultdict[str, list[ValidationError]] = defaultdict(list)
         for error in result.errors:
-            if error.category not in errors_by_category:
-                errors_by_category[error.category] = []
             errors_by_category[error.category].append(error)
 
-        # Print errors grouped by category
-        for category, errors in sorted(errors_by_category.items()):
-            error_count = sum(1 for e in errors if e.level.value == "ERROR")
+        # Report errors grouped by category
+        error_tag = _red("ERROR")
+        warn_tag = _yellow("WARN ")
+        for category in sorted(errors_by_category):
+            errors = errors_by_category[category]
+            # Header goes in lines[0] once the level counts are known
+            lines = [""]
+            error_count = 0
+            for error in errors:
+                if error.level.value == "ERROR":
+                    error_count += 1
+                    tag = error_tag
+                else:
+                    tag = warn_tag
+                path_str = f" {_dim(str(error.path))}" if error.path else ""
+                lines.append(f"  {tag}  {error.message}{path_str}")
             warn_count = len(errors) - error_count
             counts = []
             if error_count:
                 counts.append(_red(f"{error_count} errors"))
             if warn_count:
                 counts.append(_yellow(f"{warn_count} warnings"))
-            print(f"\n{_bold(category)} ({', '.join(counts)}):")
-            for error in errors:
-                level = error.level.value
-                if level == "ERROR":
-                    tag = _red("ERROR")
-                else:
-                    tag = _yellow("WARN ")
-                path_str = f" {_dim(str(error.path))}" if error.path else ""
-                print(f"  {tag}  {error.message}{path_str}")
+            lines[0] = f"\n{_bold(category)} ({', '.join(counts)}):"
+            out.write("\n".join(lines))
+            out.write("\n")
 
     if not result.is_valid:
         # Summary
@@ -252,13 +266,12 @@ def run_validate(args: argparse.Namespace) -> int:
             parts.append(_red(f"{result.error_count} errors"))
         if result.warning_count:
             parts.append(_yellow(f"{result.warning_count} warnings"))
-        print(f"\n{_red('x')} Validation failed: {', '.join(parts)}")
+        out.write(f"\n{_red('x')} Validation failed: {', '.join(parts)}\n")
+        sys.stdout.write(out.getvalue())
         return 1
     else:
-        if result.warning_count:
-            print(
-                f"\n{_green('+')} All validations passed ({_yellow(f'{result.warning_count} warnings')})"
-            )
-        else:
-            print(f"\n{_green('+')} All validations passed!")
+        out.write(
+            f"\n{_green('+')} All validations passed ({_yellow(f'{result.warning_count} warnings')})\n"
+        )
+        sys.stdout.write(out.getvalue())
         return 0
@@ -22,21 +22,46 @@ import shutil
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def load_json(path: Path) -> Any | None:
-    """Load JSON with error handling."""
+    """Load JSON with error handling, returning None if unreadable."""
+    # Imported here so that importing ofd.merge does not load the builder package
+    from ofd.builder.utils import load_json as load_json_strict
+
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return load_json_strict(path)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         return None
 
 
 def save_json(path: Path, data: Any) -> None:
-    """Save JSON with consistent 2-space formatting."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    """Save JSON with consistent 2-space formatting.
+
+    Uses orjson when installed (falling back to the stdlib for values it
+    rejects, e.g. integers beyond 64 bits). Both give the same layout, but
+    float formatting may differ: orjson writes 1e-07 as 1e-7 and NaN/Infinity
+    as null. A file that already holds exactly this content is left untouched,
+    so re-runs don't bump its mtime.
+    """
+    content = None
+    if orjson is not None:
+        try:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    if content is None:
+        content = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    try:
+        if path.stat().st_size == len(content) and path.read_bytes() == content:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(content)
 
 
 def merge_dicts(existing: dict, new: dict) -> dict:
@@ -45,12 +70,19 @@ def merge_dicts(existing: dict, new: dict) -> dict:
     A gap is a key that is missing, None, an empty string, or an empty list
     in the existing dict. Existing values are never overwritten.
     """
-    result = existing.copy()
+    return merge_dicts_into(existing.copy(), new)
+
+
+def merge_dicts_into(existing: dict, new: dict) -> dict:
+    """Like :func:`merge_dicts`, but fills the gaps in *existing* in place.
+
+    For callers that discard the pre-merge dict; returns *existing*.
+    """
     for key, value in new.items():
-        existing_value = result.get(key)
+        existing_value = existing.get(key)
         if existing_value is None or existing_value == "" or existing_value == []:
-            result[key] = value
-    return result
+            existing[key] = value
+    return existing
 
 
 def size_dedupe_key(size: dict) -> tuple:
@@ -69,14 +101,18 @@ def merge_sizes(existing: list[dict], new: list[dict]) -> list[dict]:
     Existing entries are kept as-is. New entries are appended only if their
     (weight, diameter) key doesn't already exist.
     """
-    result = list(existing)
+    return merge_sizes_into(list(existing), new)
+
+
+def merge_sizes_into(existing: list[dict], new: list[dict]) -> list[dict]:
+    """Like :func:`merge_sizes`, but appends to *existing* in place and returns it."""
     existing_keys = {size_dedupe_key(s) for s in existing}
     for size in new:
         key = size_dedupe_key(size)
         if key not in existing_keys:
-            result.append(size)
+            existing.append(size)
             existing_keys.add(key)
-    return result
+    return existing
 
 
 def merge_json_file(target: Path, source: Path) -> bool:
@@ -7,12 +7,13 @@ data without overwriting.
 """
 
 import argparse
-import json
+import functools
 import os
 import re
 import subprocess
 import urllib.parse
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -22,7 +23,7 @@ import requests
 import yaml
 
 from ofd.base import BaseScript, ScriptResult, register_script
-from ofd.merge import merge_dicts, merge_sizes
+from ofd.merge import load_json, merge_dicts_into, merge_sizes_into, save_json
 from ofd.scripts.opt_naming_rules import (
     GENERIC_RENAME_RULES,
     KNOWN_COLORS,
@@ -45,6 +46,9 @@ from ofd.scripts.opt_naming_rules import (
     strip_name_prefix,
 )
 
+# libyaml-backed loader when PyYAML was built with it; same semantics as SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # OpenPrintTag repository URL
 OPENPRINTTAG_REPO = "https://github.com/OpenPrintTag/openprinttag-database.git"
 
@@ -308,7 +312,7 @@ TAG_TO_TRAIT_MAP: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportReport:
     """Tracks import statistics and missing data."""
 
@@ -456,6 +460,79 @@ _HARDNESS_ANYWHERE = re.compile(r"\d{2,3}[ad]", re.IGNORECASE)
 # Matches a bare id/number token such as "id6" or "42" (parse garbage).
 _ID_TOKEN = re.compile(r"^id\d+$|^\d+$", re.IGNORECASE)
 
+# Product-line and material words stripped from a material name to leave its colour,
+# applied in order after the material type itself.
+_PARSE_COLOR_STRIP_RES = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"\baf\b",
+        r"\bpro\b",
+        r"\btough\b",
+        r"\bsilk\b",
+        r"\bmatte\b",
+        r"\bhigh\s*speed\b",
+        r"\bpla\+?\b",
+        r"\bpetg\b",
+        r"\babs\b",
+        r"\basa\b",
+        r"\btpu\b",
+        r"\bpctg\b",
+    )
+)
+
+# Shorter strip list used for the human-readable colour name.
+_DISPLAY_COLOR_STRIP_RES = _PARSE_COLOR_STRIP_RES[:6]
+
+_EMPTY_PARENS_RE = re.compile(r"\(\s*\)")
+_SPACE_RUN_RE = re.compile(r"\s{2,}")
+_LEADING_DASH_RE = re.compile(r"^\s*[-\u2013\u2014]\s*")
+_ID_SEPARATOR_RE = re.compile(r"[_\-]")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_TECH_SPEC_RES = tuple(re.compile(p) for p in TECH_SPEC_PATTERNS)
+
+# OPT material properties copied verbatim onto filament.json, in output key order.
+_OPT_TEMPERATURE_FIELDS = (
+    "min_print_temperature",
+    "max_print_temperature",
+    "min_bed_temperature",
+    "max_bed_temperature",
+    "preheat_temperature",
+    "chamber_temperature",
+    "min_chamber_temperature",
+    "max_chamber_temperature",
+)
+
+
+# Below this many files, process start-up costs more than parallel parsing saves.
+_PARALLEL_YAML_MIN_FILES = 256
+
+
+def _parse_yaml_bytes(data: bytes) -> Any:
+    return yaml.load(data, Loader=_YAML_LOADER)
+
+
+def _parse_yaml_file(path: Path, cache_dir: Path | None = None) -> tuple[Any, str | None]:
+    """Parse one YAML file, returning ``(data, error)``; picklable for worker processes.
+
+    With *cache_dir*, parses are reused through the builder's content-hash cache.
+    """
+    try:
+        if cache_dir is not None:
+            from ofd.builder.parse_cache import load_cached
+
+            return load_cached(path, cache_dir, _parse_yaml_bytes, ".yaml.pkl"), None
+        with open(path, "rb") as f:
+            return yaml.load(f, Loader=_YAML_LOADER), None
+    except Exception as e:
+        return None, f"Failed to load {path.name}: {e}"
+
+
+@functools.lru_cache(maxsize=256)
+def _material_type_re(material_type: str) -> re.Pattern[str]:
+    """Case-insensitive pattern for a material type, compiled once per type."""
+    return re.compile(material_type, re.IGNORECASE)
+
+
 # Extra colour/finish words recognised only when validating a hardness-stripped
 # colour remainder during regroup — kept local so the global name parser (and
 # every other brand's filament layout) is unaffected.
@@ -539,8 +616,11 @@ class ImportOpenPrintTagScript(BaseScript):
         super().__init__(project_root)
         self.report = ImportReport()
         self.brandfetch_client_id: str | None = None
+        # One session so Brandfetch requests reuse keep-alive connections
+        self.http = requests.Session()
         self.output_dir: Path = self.data_dir
         self.merge_mode: bool = True
+        self.parse_cache_dir: Path | None = None
 
     def configure_parser(self, parser: argparse.ArgumentParser) -> None:
         """Add script-specific arguments."""
@@ -564,6 +644,15 @@ class ImportOpenPrintTagScript(BaseScript):
             default=".cache/openprinttag-database",
             help="Path to cached OpenPrintTag repository",
         )
+        parser.add_argument(
+            "--parse-cache",
+            metavar="DIR",
+            default=None,
+            help=(
+                "Reuse parsed YAML across imports via a content-hash cache in DIR "
+                "(entries are pickles: only use a trusted, private directory)"
+            ),
+        )
         parser.add_argument(
             "--brand",
             help="Only import specific brand (by slug)",
@@ -592,6 +681,8 @@ class ImportOpenPrintTagScript(BaseScript):
         cache_path = self.project_root / args.cache_path
         brand_filter = args.brand
         report_path = self.project_root / args.report_path
+        if args.parse_cache:
+            self.parse_cache_dir = self.project_root / args.parse_cache
 
         # Output directory: --output-dir overrides data_dir
         if args.output_dir:
@@ -626,8 +717,9 @@ class ImportOpenPrintTagScript(BaseScript):
         # Step 2: Load all source data
         self.emit_progress("loading", 0, "Loading OpenPrintTag data...")
         brands = self._load_brands(cache_path)
-        materials = self._load_materials(cache_path)
-        packages = self._load_packages(cache_path)
+        # OPT lays out materials and packages per brand slug, so --brand skips the rest
+        materials = self._load_materials(cache_path, brand_filter)
+        packages = self._load_packages(cache_path, brand_filter)
         self.log(
             f"Loaded {len(brands)} brands, {len(materials)} materials, {len(packages)} packages"
         )
@@ -639,12 +731,12 @@ class ImportOpenPrintTagScript(BaseScript):
 
         # Step 4: Process each brand
         self.emit_progress("processing", 0, "Processing brands...")
-        total_brands = len(brands)
-
-        for i, (brand_slug, brand_data) in enumerate(sorted(brands.items())):
-            if brand_filter and brand_slug != brand_filter:
-                continue
+        selected_brands = sorted(brands.items())
+        if brand_filter:
+            selected_brands = [item for item in selected_brands if item[0] == brand_filter]
+        total_brands = len(selected_brands)
 
+        for i, (brand_slug, brand_data) in enumerate(selected_brands):
             progress = int((i / max(total_brands, 1)) * 100)
             self.emit_progress("processing", progress, f"Processing {brand_slug}...")
 
@@ -694,22 +786,51 @@ class ImportOpenPrintTagScript(BaseScript):
         else:
             self.log("Cloning OpenPrintTag repository...")
             cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Blobless sparse clone: only the data/ tree is ever checked out
             result = subprocess.run(
-                ["git", "clone", "--depth=1", OPENPRINTTAG_REPO, str(cache_path)],
+                [
+                    "git",
+                    "clone",
+                    "--depth=1",
+                    "--filter=blob:none",
+                    "--sparse",
+                    OPENPRINTTAG_REPO,
+                    str(cache_path),
+                ],
                 capture_output=True,
                 text=True,
             )
             if result.returncode != 0:
                 raise RuntimeError(f"git clone failed: {result.stderr}")
+            result = subprocess.run(
+                ["git", "-C", str(cache_path), "sparse-checkout", "set", "data"],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                raise RuntimeError(f"git sparse-checkout failed: {result.stderr}")
 
     def _load_yaml(self, path: Path) -> dict[str, Any] | None:
         """Load a YAML file."""
-        try:
-            with open(path, encoding="utf-8") as f:
-                return yaml.safe_load(f)
-        except Exception as e:
-            self.report.errors.append(f"Failed to load {path.name}: {e}")
-            return None
+        data, error = _parse_yaml_file(path, self.parse_cache_dir)
+        if error:
+            self.report.errors.append(error)
+        return data
+
+    def _load_yaml_files(self, paths: list[Path]) -> list[Any]:
+        """Load YAML files in order, parsing across processes when there are many."""
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(paths) < _PARALLEL_YAML_MIN_FILES:
+            return [self._load_yaml(path) for path in paths]
+
+        loaded = []
+        parse = functools.partial(_parse_yaml_file, cache_dir=self.parse_cache_dir)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for data, error in executor.map(parse, paths, chunksize=64):
+                if error:
+                    self.report.errors.append(error)
+                loaded.append(data)
+        return loaded
 
     def _load_brands(self, cache_path: Path) -> dict[str, dict]:
         """Load all brand YAML files."""
@@ -726,39 +847,37 @@ class ImportOpenPrintTagScript(BaseScript):
 
         return brands
 
-    def _load_materials(self, cache_path: Path) -> list[dict]:
-        """Load all material YAML files."""
+    def _load_materials(self, cache_path: Path, brand: str | None = None) -> list[dict]:
+        """Load all material YAML files, or only those under *brand*'s directory."""
         materials: list[dict] = []
         materials_dir = cache_path / "data" / "materials"
 
         if not materials_dir.exists():
             return materials
 
+        yaml_files = []
         for brand_dir in sorted(materials_dir.iterdir()):
-            if not brand_dir.is_dir():
-                continue
-            for yaml_file in sorted(brand_dir.glob("*.yaml")):
-                data = self._load_yaml(yaml_file)
-                if data:
-                    materials.append(data)
+            if brand_dir.is_dir() and brand in (None, brand_dir.name):
+                yaml_files.extend(sorted(brand_dir.glob("*.yaml")))
+
+        materials.extend(data for data in self._load_yaml_files(yaml_files) if data)
 
         return materials
 
-    def _load_packages(self, cache_path: Path) -> list[dict]:
-        """Load all material package YAML files."""
+    def _load_packages(self, cache_path: Path, brand: str | None = None) -> list[dict]:
+        """Load all material package YAML files, or only those under *brand*'s directory."""
         packages: list[dict] = []
         packages_dir = cache_path / "data" / "material-packages"
 
         if not packages_dir.exists():
             return packages
 
+        yaml_files = []
         for brand_dir in sorted(packages_dir.iterdir()):
-            if not brand_dir.is_dir():
-                continue
-            for yaml_file in sorted(brand_dir.glob("*.yaml")):
-                data = self._load_yaml(yaml_file)
-                if data:
-                    packages.append(data)
+            if brand_dir.is_dir() and brand in (None, brand_dir.name):
+                yaml_files.extend(sorted(brand_dir.glob("*.yaml")))
+
+        packages.extend(data for data in self._load_yaml_files(yaml_files) if data)
 
         return packages
 
@@ -821,14 +940,8 @@ class ImportOpenPrintTagScript(BaseScript):
             brand_dir = self.output_dir / brand_id
 
         # Check for existing brand data
-        existing_brand: dict | None = None
         brand_json_path = brand_dir / "brand.json"
-        if brand_json_path.exists():
-            try:
-                with open(brand_json_path, encoding="utf-8") as f:
-                    existing_brand = json.load(f)
-            except Exception:
-                pass
+        existing_brand: dict | None = load_json(brand_json_path)
 
         # Convert OPT brand to internal format
         countries = brand_data.get("countries_of_origin", [])
@@ -854,8 +967,13 @@ class ImportOpenPrintTagScript(BaseScript):
         # Check if we need website/logo
         need_website = not merged_brand.get("website")
         need_logo = True
+        # One directory read instead of a stat per candidate extension
+        try:
+            brand_files = set(os.listdir(brand_dir))
+        except OSError:
+            brand_files = set()
         for ext in ["png", "jpg", "svg", "jpeg"]:
-            if (brand_dir / f"logo.{ext}").exists():
+            if f"logo.{ext}" in brand_files:
                 need_logo = False
                 merged_brand["logo"] = f"logo.{ext}"
                 break
@@ -881,7 +999,7 @@ class ImportOpenPrintTagScript(BaseScript):
         # Write brand.json
         if not dry_run:
             brand_dir.mkdir(parents=True, exist_ok=True)
-            self._save_json(brand_json_path, merged_brand)
+            save_json(brand_json_path, merged_brand)
 
         # Process materials for this brand
         self._process_materials(
@@ -920,7 +1038,7 @@ class ImportOpenPrintTagScript(BaseScript):
 
         # Normalize function for comparison - removes underscores, hyphens
         def normalize(s: str) -> str:
-            return re.sub(r"[_\-]", "", s.lower())
+            return _ID_SEPARATOR_RE.sub("", s.lower())
 
         normalized_id = normalize(brand_id)
         normalized_name = normalize(brand_name)
@@ -978,8 +1096,11 @@ class ImportOpenPrintTagScript(BaseScript):
         return None
 
     def _merge_data(self, existing: dict, new: dict) -> dict:
-        """Merge new data into existing, only filling gaps."""
-        return merge_dicts(existing, new)
+        """Merge new data into existing in place, only filling gaps.
+
+        Every caller loads *existing* fresh from disk and only keeps the result.
+        """
+        return merge_dicts_into(existing, new)
 
     def _discover_domain(self, brand_name: str) -> str | None:
         """Try to find brand domain using Brandfetch CDN, then search API."""
@@ -987,7 +1108,7 @@ class ImportOpenPrintTagScript(BaseScript):
             return None
 
         # Normalize brand name for domain guessing
-        normalized = re.sub(r"[^a-z0-9]", "", brand_name.lower())
+        normalized = _NON_ALNUM_RE.sub("", brand_name.lower())
 
         # Domain patterns to try
         patterns = [
@@ -1002,7 +1123,7 @@ class ImportOpenPrintTagScript(BaseScript):
         for domain in patterns:
             url = f"https://cdn.brandfetch.io/{domain}?c={self.brandfetch_client_id}"
             try:
-                response = requests.head(url, timeout=5)
+                response = self.http.head(url, timeout=5)
                 if response.ok:
                     return f"https://{domain}"
             except Exception:
@@ -1027,7 +1148,7 @@ class ImportOpenPrintTagScript(BaseScript):
         headers = {"Authorization": f"Bearer {self.brandfetch_client_id}"}
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url, headers=headers, timeout=10)
             if response.ok:
                 results = response.json()
                 # Take the first/best match if available
@@ -1051,7 +1172,7 @@ class ImportOpenPrintTagScript(BaseScript):
 
         url = f"https://cdn.brandfetch.io/{domain_only}?c={self.brandfetch_client_id}"
         try:
-            response = requests.get(url, timeout=10)
+            response = self.http.get(url, timeout=10)
             if response.ok:
                 content_type = response.headers.get("content-type", "").lower()
 
@@ -1164,28 +1285,16 @@ class ImportOpenPrintTagScript(BaseScript):
                 }
 
                 # Add temperature data: from OPT if available, otherwise from defaults
-                temp_fields = [
-                    "min_print_temperature",
-                    "max_print_temperature",
-                    "min_bed_temperature",
-                    "max_bed_temperature",
-                    "preheat_temperature",
-                    "chamber_temperature",
-                    "min_chamber_temperature",
-                    "max_chamber_temperature",
-                ]
-
                 if "min_print_temperature" in properties:
                     # Use OPT temperatures
-                    for field in temp_fields:
-                        if field in properties:
-                            filament_data[field] = properties[field]
+                    filament_data.update(
+                        {f: properties[f] for f in _OPT_TEMPERATURE_FIELDS if f in properties}
+                    )
                 else:
                     # Apply defaults based on material type
                     temp_defaults = TEMPERATURE_DEFAULTS.get(material_type, {})
                     if temp_defaults:
-                        for field, value in temp_defaults.items():
-                            filament_data[field] = value
+                        filament_data.update(temp_defaults)
                     else:
                         # No defaults available - track as missing
                         self.report.missing_temperatures.append(
@@ -1259,24 +1368,10 @@ class ImportOpenPrintTagScript(BaseScript):
         # Extract color by removing known parts from name
         color = name
         # Remove material type mentions and common prefixes
-        remove_patterns = [
-            material_type,
-            type_lower,
-            r"\baf\b",
-            r"\bpro\b",
-            r"\btough\b",
-            r"\bsilk\b",
-            r"\bmatte\b",
-            r"\bhigh\s*speed\b",
-            r"\bpla\+?\b",
-            r"\bpetg\b",
-            r"\babs\b",
-            r"\basa\b",
-            r"\btpu\b",
-            r"\bpctg\b",
-        ]
-        for pattern in remove_patterns:
-            color = re.sub(pattern, "", color, flags=re.IGNORECASE)
+        color = _material_type_re(material_type).sub("", color)
+        color = _material_type_re(type_lower).sub("", color)
+        for pattern in _PARSE_COLOR_STRIP_RES:
+            color = pattern.sub("", color)
 
         color = color.strip(" ,-+")
         color_id = slugify(color) if color else "default"
@@ -1305,17 +1400,9 @@ class ImportOpenPrintTagScript(BaseScript):
 
         # Remove material type and common prefixes
         color = name
-        remove_patterns = [
-            material_type,
-            r"\baf\b",
-            r"\bpro\b",
-            r"\btough\b",
-            r"\bsilk\b",
-            r"\bmatte\b",
-            r"\bhigh\s*speed\b",
-        ]
-        for pattern in remove_patterns:
-            color = re.sub(pattern, "", color, flags=re.IGNORECASE)
+        color = _material_type_re(material_type).sub("", color)
+        for pattern in _DISPLAY_COLOR_STRIP_RES:
+            color = pattern.sub("", color)
 
         color = color.strip(" ,-+")
 
@@ -1355,8 +1442,9 @@ class ImportOpenPrintTagScript(BaseScript):
         """Convert OPT tags to internal traits dict."""
         traits: dict[str, bool] = {}
         for tag in tags:
-            if tag in TAG_TO_TRAIT_MAP:
-                traits[TAG_TO_TRAIT_MAP[tag]] = True
+            trait = TAG_TO_TRAIT_MAP.get(tag)
+            if trait is not None:
+                traits[trait] = True
         return traits
 
     # ------------------------------------------------------------------
@@ -1706,7 +1794,7 @@ class ImportOpenPrintTagScript(BaseScript):
                     name_pattern = rule.get("name_pattern", "")
                     if name_pattern and old_name:
                         new_name = re.sub(name_pattern, "", old_name).strip()
-                        new_name = re.sub(r"^\s*[-\u2013\u2014]\s*", "", new_name).strip()
+                        new_name = _LEADING_DASH_RE.sub("", new_name).strip()
                         if new_name:
                             entry["variant"]["name"] = new_name
                         else:
@@ -2012,14 +2100,14 @@ class ImportOpenPrintTagScript(BaseScript):
     @staticmethod
     def _clean_variant_name(old_name: str, prefix: str, new_id: str) -> str:
         """Derive a clean display name for a variant after prefix stripping."""
-        cleaned = re.sub(r"\(\s*\)", "", old_name).strip()
+        cleaned = _EMPTY_PARENS_RE.sub("", old_name).strip()
 
         # Build a regex from the prefix slug
         sep = r"[\s_+\-.*]*"
         parts = prefix.rstrip("_").split("_")
         pattern_str = r"^" + sep.join(re.escape(p) for p in parts) + sep
         cleaned = re.sub(pattern_str, "", cleaned, flags=re.IGNORECASE).strip()
-        cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
+        cleaned = _SPACE_RUN_RE.sub(" ", cleaned).strip()
 
         if cleaned:
             return cleaned
@@ -2039,8 +2127,8 @@ class ImportOpenPrintTagScript(BaseScript):
                         continue
 
                     new_name = name
-                    new_name = re.sub(r"\(\s*\)", "", new_name)
-                    new_name = re.sub(r"\s{2,}", " ", new_name)
+                    new_name = _EMPTY_PARENS_RE.sub("", new_name)
+                    new_name = _SPACE_RUN_RE.sub(" ", new_name)
                     new_name = new_name.strip()
 
                     if not new_name:
@@ -2066,13 +2154,11 @@ class ImportOpenPrintTagScript(BaseScript):
         hierarchy: dict[str, dict[str, dict[str, dict]]],
     ) -> None:
         """Emit report-only warnings for tech specs and long names (Cats 4 & 6)."""
-        compiled_patterns = [re.compile(p) for p in TECH_SPEC_PATTERNS]
-
         for material_type, filaments in hierarchy.items():
             for filament_id, colors in filaments.items():
                 for color_id in sorted(colors.keys()):
                     # Cat 4: Technical specs
-                    for pattern in compiled_patterns:
+                    for pattern in _TECH_SPEC_RES:
                         if pattern.search(color_id):
                             self.report.tech_spec_warnings.append(
                                 f"{brand_id}/{material_type}/"
@@ -2105,21 +2191,20 @@ class ImportOpenPrintTagScript(BaseScript):
         if not brand_dir.exists():
             return index
 
-        for material_dir in brand_dir.iterdir():
-            if not material_dir.is_dir() or material_dir.name.startswith("."):
+        # scandir reuses the entry type from the directory read instead of a stat each
+        for material_entry in os.scandir(brand_dir):
+            if not material_entry.is_dir() or material_entry.name.startswith("."):
                 continue
-            material_type = material_dir.name
-            index[material_type] = {}
+            filaments = index[material_entry.name] = {}
 
-            for filament_dir in material_dir.iterdir():
-                if not filament_dir.is_dir():
+            for filament_entry in os.scandir(material_entry.path):
+                if not filament_entry.is_dir():
                     continue
-                filament_id = filament_dir.name
-                index[material_type][filament_id] = set()
-
-                for variant_dir in filament_dir.iterdir():
-                    if variant_dir.is_dir():
-                        index[material_type][filament_id].add(variant_dir.name)
+                filaments[filament_entry.name] = {
+                    variant_entry.name
+                    for variant_entry in os.scandir(filament_entry.path)
+                    if variant_entry.is_dir()
+                }
 
         return index
 
@@ -2316,14 +2401,17 @@ class ImportOpenPrintTagScript(BaseScript):
         for material_type in sorted(hierarchy.keys()):
             filaments = hierarchy[material_type]
             material_dir = brand_dir / material_type
+            # existing_index mirrors the on-disk tree, so known dirs skip mkdir
+            existing_filaments = existing_index.get(material_type)
 
             if not dry_run:
-                material_dir.mkdir(parents=True, exist_ok=True)
+                if existing_filaments is None:
+                    material_dir.mkdir(parents=True, exist_ok=True)
 
                 # Write material.json
                 material_json = material_dir / "material.json"
                 if not material_json.exists() or not self.merge_mode:
-                    self._save_json(material_json, {"material": material_type})
+                    save_json(material_json, {"material": material_type})
 
             for filament_id in sorted(filaments.keys()):
                 colors = filaments[filament_id]
@@ -2339,20 +2427,19 @@ class ImportOpenPrintTagScript(BaseScript):
                 # Get filament data from first color (they share filament data)
                 first_color_data = next(iter(colors.values()))
                 filament_data = first_color_data.get("filament", {})
+                existing_variants = (existing_filaments or {}).get(filament_id)
 
                 if not dry_run:
-                    filament_dir.mkdir(parents=True, exist_ok=True)
+                    if existing_variants is None:
+                        filament_dir.mkdir(parents=True, exist_ok=True)
 
                     # Write filament.json
                     filament_json = filament_dir / "filament.json"
-                    if self.merge_mode and filament_json.exists():
-                        try:
-                            with open(filament_json, encoding="utf-8") as f:
-                                existing = json.load(f)
+                    if self.merge_mode:
+                        existing = load_json(filament_json)
+                        if isinstance(existing, dict):
                             filament_data = self._merge_data(existing, filament_data)
-                        except Exception:
-                            pass
-                    self._save_json(filament_json, filament_data)
+                    save_json(filament_json, filament_data)
 
                 self.report.filaments_created += 1
 
@@ -2365,40 +2452,29 @@ class ImportOpenPrintTagScript(BaseScript):
                     sizes_data = color_data.get("sizes", [])
 
                     if not dry_run:
-                        variant_dir.mkdir(parents=True, exist_ok=True)
+                        if existing_variants is None or color_id not in existing_variants:
+                            variant_dir.mkdir(parents=True, exist_ok=True)
 
                         # Write variant.json
                         variant_json = variant_dir / "variant.json"
-                        if self.merge_mode and variant_json.exists():
-                            try:
-                                with open(variant_json, encoding="utf-8") as f:
-                                    existing = json.load(f)
+                        if self.merge_mode:
+                            existing = load_json(variant_json)
+                            if isinstance(existing, dict):
                                 variant_data = self._merge_data(existing, variant_data)
-                            except Exception:
-                                pass
-                        self._save_json(variant_json, variant_data)
+                        save_json(variant_json, variant_data)
 
                         # Write sizes.json
                         sizes_json = variant_dir / "sizes.json"
-                        if self.merge_mode and sizes_json.exists():
-                            try:
-                                with open(sizes_json, encoding="utf-8") as f:
-                                    existing_sizes = json.load(f)
-                                sizes_data = merge_sizes(existing_sizes, sizes_data)
-                            except Exception:
-                                pass
+                        if self.merge_mode:
+                            existing_sizes = load_json(sizes_json)
+                            if isinstance(existing_sizes, list):
+                                sizes_data = merge_sizes_into(existing_sizes, sizes_data)
 
                         # Create default size if no sizes data
                         if not sizes_data:
                             sizes_data = [{"filament_weight": 1000, "diameter": 1.75}]
 
-                        self._save_json(sizes_json, sizes_data)
+                        save_json(sizes_json, sizes_data)
                         self.report.sizes_created += len(sizes_data)
 
                     self.report.variants_created += 1
-
-    def _save_json(self, path: Path, data: Any) -> None:
-        """Save data to JSON file with consistent formatting."""
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
@@ -1582,13 +1582,18 @@ GENERIC_RENAME_RULES = [
 # ---------------------------------------------------------------------------
 
 
+_SEPARATOR_RUN_RE = re.compile(r"[-\s]+")
+_NON_ID_CHAR_RE = re.compile(r"[^a-z0-9_]")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+
 def slugify(text: str) -> str:
     """Convert text to a valid ID (lowercase, underscores)."""
     text = text.lower()
-    text = re.sub(r"[-\s]+", "_", text)
-    text = re.sub(r"[^a-z0-9_]", "", text)
+    text = _SEPARATOR_RUN_RE.sub("_", text)
+    text = _NON_ID_CHAR_RE.sub("", text)
     text = text.strip("_")
-    text = re.sub(r"_+", "_", text)
+    text = _UNDERSCORE_RUN_RE.sub("_", text)
     return text or "default"
 
 
@@ -22,7 +22,10 @@ Pipeline (runs in order):
 
 import argparse
 import json
+import os
 import re
+import shutil
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -119,7 +122,8 @@ def _is_tracking_key(key: str) -> bool:
 def _is_tracking_fragment(fragment: str) -> bool:
     if "=" not in fragment:
         return False
-    return _is_tracking_key(re.split(r"[&=]", fragment, maxsplit=1)[0])
+    # Key of the first pair: everything before the first '&' or '='
+    return _is_tracking_key(fragment.split("&", 1)[0].split("=", 1)[0])
 
 
 def strip_tracking_params(url: str) -> str:
@@ -192,13 +196,42 @@ def load_json(path: Path) -> dict[str, Any] | None:
         return None
 
 
-def save_json(path: Path, data: Any, dry_run: bool) -> None:
-    """Save JSON to file with consistent formatting."""
-    if dry_run:
+def save_json(path: Path, data: Any, dry_run: bool) -> bool:
+    """Save JSON to file with consistent formatting.
+
+    Returns False without touching the file when it already holds exactly the
+    formatted content, True when it was (or, in dry-run mode, would be) written.
+    """
+    content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    if not dry_run:
+        write_text_atomic(path, content)
+    return True
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """Replace a file's content via a temp file + os.replace, keeping its mode.
+
+    A crash mid-write leaves the original file intact instead of truncated.
+    """
+    if not path.exists():
+        # Nothing to protect; a plain write also gets the default permissions
+        path.write_text(content, encoding="utf-8")
         return
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def fix_slug(name: str) -> str:
@@ -536,8 +569,7 @@ class StyleDataScript(BaseScript):
 
             if not dry_run:
                 try:
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(new_content)
+                    write_text_atomic(file_path, new_content)
                 except OSError as e:
                     self.log(f"Error writing {file_path}: {e}")
                     stats.files_skipped += 1
@@ -778,12 +810,12 @@ class StyleDataScript(BaseScript):
         stats.files_processed += 1
 
         modified = bool(sanitize_changes) or (original_json != sorted_json)
-        if modified:
+        # save_json skips the write when the formatted output already matches disk
+        if modified and save_json(file_path, sorted_data, dry_run):
             if dry_run:
                 self.log(f"  Would sort: {file_path.name}")
             else:
                 self.log(f"  Sorted: {file_path.name}")
-            save_json(file_path, sorted_data, dry_run)
             stats.files_modified += 1
             return True
 
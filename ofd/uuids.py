@@ -141,10 +141,16 @@ def assign_uuid(entity: Entity, value: str) -> None:
 
     Reorders in place (clear + re-insert) so the same object reference is kept and
     the container stays consistent; callers still persist via :func:`save_container`.
+    When ``uuid`` is already the first key, overwriting it keeps its position, so
+    the rebuild is skipped.
     """
-    ordered = [("uuid", value)] + [(k, v) for k, v in entity.obj.items() if k != "uuid"]
-    entity.obj.clear()
-    entity.obj.update(ordered)
+    obj = entity.obj
+    if next(iter(obj), None) == "uuid":
+        obj["uuid"] = value
+        return
+    ordered = [("uuid", value)] + [(k, v) for k, v in obj.items() if k != "uuid"]
+    obj.clear()
+    obj.update(ordered)
 
 
 def _absorb_moved_from(target: dict[str, Any], source: dict[str, Any]) -> list[str]:
@@ -14,10 +14,13 @@ filament so a mixed filament can never merge.
 """
 
 import json
+import os
 from pathlib import Path
 
 from ofd_validator import ValidationError, ValidationLevel
 
+from ofd.builder.utils import load_json
+
 CARBON_FIBER_TRAIT = "contains_carbon_fiber"
 GLASS_FIBER_TRAIT = "contains_glass_fiber"
 
@@ -26,12 +29,19 @@ CATEGORY = "fiber_consistency"
 
 def _load_json(path: Path):
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return load_json(path)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         return None
 
 
+def _subdirs(path: Path) -> list[Path]:
+    """Sorted subdirectories of path, using scandir's cached entry type instead of a stat each."""
+    with os.scandir(path) as it:
+        names = [entry.name for entry in it if entry.is_dir()]
+    names.sort()
+    return [path / name for name in names]
+
+
 def _variant_fibers(traits) -> set[str]:
     """Fiber kinds ('carbon' / 'glass') a variant carries, from its traits."""
     fibers: set[str] = set()
@@ -65,26 +75,16 @@ def check_fiber_consistency(data_dir) -> list[ValidationError]:
 
     base = data_dir.parent
 
-    for brand_dir in sorted(data_dir.iterdir()):
-        if not brand_dir.is_dir():
-            continue
-        for material_dir in sorted(brand_dir.iterdir()):
-            if not material_dir.is_dir():
-                continue
-            for filament_dir in sorted(material_dir.iterdir()):
-                if not filament_dir.is_dir():
-                    continue
-
+    for brand_dir in _subdirs(data_dir):
+        for material_dir in _subdirs(brand_dir):
+            for filament_dir in _subdirs(material_dir):
                 carbon_only: list[str] = []
                 glass_only: list[str] = []
                 both: list[str] = []
 
-                for variant_dir in sorted(filament_dir.iterdir()):
-                    if not variant_dir.is_dir():
-                        continue
+                for variant_dir in _subdirs(filament_dir):
+                    # A missing variant.json is an OSError, so _load_json returns None
                     variant_file = variant_dir / "variant.json"
-                    if not variant_file.exists():
-                        continue
                     data = _load_json(variant_file)
                     if not isinstance(data, dict):
                         continue
@@ -0,0 +1,36 @@
+"""Tests for the lazily indexed Database.get_* lookups."""
+
+from ofd.builder.models import Database
+
+
+def test_lookup_sees_entities_appended_after_first_lookup():
+    db = Database(brands=[{"id": "acme", "name": "Acme"}])
+    assert db.get_brand("acme") == {"id": "acme", "name": "Acme"}
+    assert db.get_brand("zeta") is None
+
+    db.brands.append({"id": "zeta", "name": "Zeta"})
+    assert db.get_brand("zeta") == {"id": "zeta", "name": "Zeta"}
+
+
+def test_lookup_sees_replaced_list():
+    db = Database(stores=[{"id": "a"}])
+    assert db.get_store("a") == {"id": "a"}
+
+    db.stores = [{"id": "b"}]
+    assert db.get_store("a") is None
+    assert db.get_store("b") == {"id": "b"}
+
+
+def test_first_entity_with_an_id_wins():
+    db = Database(sizes=[{"id": "s", "n": 1}, {"id": "s", "n": 2}])
+    assert db.get_size("s")["n"] == 1
+
+
+def test_reindex_picks_up_changed_ids():
+    db = Database(variants=[{"id": "old"}])
+    assert db.get_variant("old") is not None
+
+    db.variants[0]["id"] = "new"
+    db.reindex()
+    assert db.get_variant("old") is None
+    assert db.get_variant("new") == {"id": "new"}
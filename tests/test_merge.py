@@ -0,0 +1,59 @@
+"""Tests for the gap-filling merge helpers in ofd.merge."""
+
+from ofd.merge import merge_dicts, merge_dicts_into, merge_sizes, merge_sizes_into
+
+
+def test_merge_dicts_into_fills_only_gaps_in_place():
+    existing = {"name": "Kept", "website": "", "tags": [], "origin": None}
+    new = {"name": "Ignored", "website": "https://a.example", "tags": ["x"], "origin": "CZ"}
+
+    result = merge_dicts_into(existing, new)
+
+    assert result is existing
+    assert existing == {
+        "name": "Kept",
+        "website": "https://a.example",
+        "tags": ["x"],
+        "origin": "CZ",
+    }
+    assert new == {"name": "Ignored", "website": "https://a.example", "tags": ["x"], "origin": "CZ"}
+
+
+def test_merge_dicts_leaves_existing_untouched():
+    existing = {"name": "Kept", "website": ""}
+    new = {"website": "https://a.example", "logo": "logo.png"}
+
+    result = merge_dicts(existing, new)
+
+    assert result is not existing
+    assert existing == {"name": "Kept", "website": ""}
+    assert result == {"name": "Kept", "website": "https://a.example", "logo": "logo.png"}
+
+
+def test_merge_sizes_into_appends_unseen_spools_in_place():
+    existing = [{"filament_weight": 1000, "diameter": 1.75, "gtin": "1"}]
+    new = [
+        {"filament_weight": 1000, "diameter": 1.75, "gtin": "2"},
+        {"filament_weight": 250, "diameter": 1.75},
+        {"filament_weight": 250, "diameter": 1.75, "gtin": "3"},
+    ]
+
+    result = merge_sizes_into(existing, new)
+
+    assert result is existing
+    assert existing == [
+        {"filament_weight": 1000, "diameter": 1.75, "gtin": "1"},
+        {"filament_weight": 250, "diameter": 1.75},
+    ]
+    assert len(new) == 3
+
+
+def test_merge_sizes_leaves_existing_untouched():
+    existing = [{"filament_weight": 1000, "diameter": 1.75}]
+    new = [{"filament_weight": 500, "diameter": 2.85}]
+
+    result = merge_sizes(existing, new)
+
+    assert result is not existing
+    assert existing == [{"filament_weight": 1000, "diameter": 1.75}]
+    assert result == existing + new
@@ -0,0 +1,63 @@
+"""Tests for the content-addressed parse cache."""
+
+import json
+
+from ofd.builder.parse_cache import load_cached
+from ofd.builder.utils import loads_json
+
+
+def load_json_cached(path, cache_dir):
+    return load_cached(path, cache_dir, loads_json)
+
+
+def test_cache_hit_returns_equal_data(tmp_path):
+    cache = tmp_path / "cache"
+    src = tmp_path / "brand.json"
+    src.write_text(json.dumps({"id": "acme", "name": "Acme"}), encoding="utf-8")
+
+    first = load_json_cached(src, cache)
+    assert list(cache.rglob("*.pkl"))
+    assert load_json_cached(src, cache) == first == {"id": "acme", "name": "Acme"}
+
+
+def test_identical_content_shares_an_entry(tmp_path):
+    cache = tmp_path / "cache"
+    a = tmp_path / "a.json"
+    b = tmp_path / "b.json"
+    a.write_text('{"x": 1}', encoding="utf-8")
+    b.write_text('{"x": 1}', encoding="utf-8")
+
+    load_json_cached(a, cache)
+    load_json_cached(b, cache)
+    assert len(list(cache.rglob("*.pkl"))) == 1
+
+
+def test_edited_file_is_reparsed(tmp_path):
+    cache = tmp_path / "cache"
+    src = tmp_path / "variant.json"
+    src.write_text('{"name": "Red"}', encoding="utf-8")
+    load_json_cached(src, cache)
+
+    src.write_text('{"name": "Blue"}', encoding="utf-8")
+    assert load_json_cached(src, cache) == {"name": "Blue"}
+
+
+def test_corrupt_entry_is_treated_as_miss(tmp_path):
+    cache = tmp_path / "cache"
+    src = tmp_path / "sizes.json"
+    src.write_text("[]", encoding="utf-8")
+    load_json_cached(src, cache)
+
+    (entry,) = cache.rglob("*.pkl")
+    entry.write_bytes(b"not a pickle")
+    assert load_json_cached(src, cache) == []
+
+
+def test_suffix_keeps_loaders_apart(tmp_path):
+    cache = tmp_path / "cache"
+    src = tmp_path / "material.yaml"
+    src.write_text("[1, 2]", encoding="utf-8")
+
+    assert load_json_cached(src, cache) == [1, 2]
+    assert load_cached(src, cache, lambda data: "parsed", ".yaml.pkl") == "parsed"
+    assert len(list(cache.rglob("*.pkl"))) == 2
@@ -0,0 +1,40 @@
+"""Tests for the DDL-derived SQLite column lists."""
+
+import sqlite3
+
+import pytest
+
+from ofd.builder.exporters.sqlite_exporter import SCHEMA_DDL, TABLE_COLUMNS
+from ofd.builder.exporters.sqlite_stores_exporter import (
+    STORES_SCHEMA_DDL,
+    STORES_TABLE_COLUMNS,
+)
+from ofd.builder.serialization import parse_table_columns
+
+
+@pytest.mark.parametrize(
+    ("ddl", "columns"),
+    [(SCHEMA_DDL, TABLE_COLUMNS), (STORES_SCHEMA_DDL, STORES_TABLE_COLUMNS)],
+)
+def test_parsed_columns_match_pragma(ddl, columns):
+    cursor = sqlite3.connect(":memory:").cursor()
+    cursor.executescript(ddl)
+    tables = [row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+
+    assert sorted(columns) == sorted(tables)
+    for table in tables:
+        pragma = tuple(row[1] for row in cursor.execute(f"PRAGMA table_info({table})"))
+        assert columns[table] == pragma
+
+
+def test_table_constraints_and_comments_are_skipped():
+    ddl = """
+CREATE TABLE IF NOT EXISTS pair (
+    a TEXT NOT NULL,  -- first
+    -- a full-line comment
+    b INTEGER REFERENCES other(id),
+    PRIMARY KEY (a, b),
+    UNIQUE (b)
+);
+"""
+    assert parse_table_columns(ddl) == {"pair": ("a", "b")}
@@ -0,0 +1,32 @@
+"""Tests for parsing parent UUIDs into their binary form."""
+
+import uuid
+
+import pytest
+
+from ofd.builder.utils import _uuid_bytes
+
+SAMPLE = uuid.UUID("1f0e6d3c-2b4a-5968-8776-a5b4c3d2e1f0")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [SAMPLE, str(SAMPLE), str(SAMPLE).upper(), "{" + str(SAMPLE) + "}", SAMPLE.hex],
+)
+def test_accepted_spellings_match_uuid(value):
+    assert _uuid_bytes(value) == SAMPLE.bytes
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "0" * 36,
+        "12345678 1234 1234 1234 123456789abc",
+        "12345678-1234-1234-1234-12345678 abc",
+        "1234567--1234-1234-1234-123456789abc",
+        "12345678-1234-1234-1234-123456789abg",
+    ],
+)
+def test_malformed_36_char_strings_are_rejected(value):
+    with pytest.raises(ValueError):
+        _uuid_bytes(value)